@@ -2,8 +2,9 @@ from typing import Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
+from sqlalchemy import select, lambda_stmt
 from sqlalchemy.orm import Session
-from .database import SessionLocal
+from ...database import SessionLocal
 from ..core.config import settings
 from ..models.user import User
 from ..core.redis import redis_manager
@@ -45,7 +46,10 @@ def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    # Runs on every authenticated request; lambda_stmt caches the compiled SQL
+    user = db.execute(
+        lambda_stmt(lambda: select(User).where(User.id == user_id))
+    ).scalar_one_or_none()
     if user is None:
         raise credentials_exception
     
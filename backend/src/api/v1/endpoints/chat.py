@@ -5,6 +5,7 @@ from ..dependencies import get_db, get_current_user
 from ...services.chat_service import ChatService
 from ...models.user import User
 from ...core.config import settings
+from ...utils.pagination import encode_cursor, decode_cursor
 import logging
 import json
 
@@ -17,13 +18,25 @@ async def get_chat_history(
     community_id: int = Query(..., description="Community ID"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get chat history for a community"""
     try:
+        before = None
+        if cursor:
+            before = decode_cursor(cursor)
+            if before is None:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+        
         chat_service = ChatService(db)
-        messages = await chat_service.get_chat_history(community_id, limit, offset)
+        messages = await chat_service.get_chat_history(community_id, limit, offset, before)
+        
+        next_cursor = None
+        if len(messages) == limit:
+            last = messages[-1]
+            next_cursor = encode_cursor(last['created_at'], last['id'])
         
         return {
             "success": True,
@@ -31,10 +44,13 @@ async def get_chat_history(
                 "messages": messages,
                 "community_id": community_id,
                 "limit": limit,
-                "offset": offset
+                "offset": offset,
+                "next_cursor": next_cursor
             }
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Get chat history API error: {e}")
         raise HTTPException(status_code=500, detail="Failed to get chat history")
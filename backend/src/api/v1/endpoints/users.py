@@ -1,5 +1,6 @@
 from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, lambda_stmt
 from sqlalchemy.orm import Session
 from ..dependencies import get_db, get_current_user
 from ...models.user import User
@@ -20,7 +21,9 @@ async def get_user_profile(
 ):
     """Get user profile by username"""
     try:
-        user = db.query(User).filter(User.username == username).first()
+        user = db.execute(
+            lambda_stmt(lambda: select(User).where(User.username == username))
+        ).scalar_one_or_none()
         
         if not user:
             raise HTTPException(
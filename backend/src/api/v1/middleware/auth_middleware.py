@@ -146,11 +146,15 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     def __init__(
         self, 
         app, 
-        redis_client,
-        rate_limits: Dict[str, int] = None
+        redis_client=None,
+        rate_limits: Dict[str, int] = None,
+        redis_client_factory: Optional[Callable[[], Any]] = None
     ):
         super().__init__(app)
+        # Middleware is built at import time, before Redis connects, so the
+        # client can be resolved lazily on each request through the factory
         self.redis = redis_client
+        self.redis_client_factory = redis_client_factory
         self.rate_limits = rate_limits or {
             "default": 100,  # 100 requests per minute
             "search": 20,    # 20 search requests per minute
@@ -173,13 +177,18 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         category = self._get_rate_limit_category(request.url.path)
         limit = self.rate_limits.get(category, self.rate_limits["default"])
         
+        redis = self.redis or (self.redis_client_factory and self.redis_client_factory())
+        if redis is None:
+            # Redis not configured or not connected yet: don't block traffic
+            return await call_next(request)
+        
         # Check rate limit
         rate_limit_key = f"rate_limit:{user_id}:{category}"
-        current_count = await self.redis.get(rate_limit_key)
+        current_count = await redis.get(rate_limit_key)
         
         if current_count is None:
             # First request in window
-            await self.redis.setex(rate_limit_key, 60, 1)  # 1-minute window
+            await redis.setex(rate_limit_key, 60, 1)  # 1-minute window
         else:
             current_count = int(current_count)
             if current_count >= limit:
@@ -189,7 +198,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 )
             
             # Increment counter
-            await self.redis.incr(rate_limit_key)
+            await redis.incr(rate_limit_key)
         
         # Continue with the request
         return await call_next(request)
@@ -28,6 +28,30 @@ class Settings:
     def SUPABASE_ANON_KEY(self) -> str:
         return settings.supabase_anon_key
     
+    @property
+    def DATABASE_URL(self) -> str:
+        return settings.get('DATABASE_URL', '')
+    
+    @property
+    def DATABASE_POOL_SIZE(self) -> int:
+        return settings.get_int('DATABASE_POOL_SIZE', 25)
+    
+    @property
+    def DATABASE_MAX_OVERFLOW(self) -> int:
+        return settings.get_int('DATABASE_MAX_OVERFLOW', 25)
+    
+    @property
+    def DATABASE_POOL_RECYCLE(self) -> int:
+        return settings.get_int('DATABASE_POOL_RECYCLE', 1800)
+    
+    @property
+    def HNSW_EF_SEARCH(self) -> int:
+        return settings.get_int('HNSW_EF_SEARCH', 100)
+    
+    @property
+    def IVFFLAT_PROBES(self) -> int:
+        return settings.get_int('IVFFLAT_PROBES', 10)
+    
     @property
     def REDIS_URL(self) -> str:
         return settings.redis_url
@@ -0,0 +1,68 @@
+from typing import Iterable, Optional
+import asyncio
+import logging
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# h2 import with fallback (HTTP/2 multiplexes concurrent calls to one host
+# over a single TLS connection)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Outbound API pool: Groq, OpenRouter and Akismet share keep-alive connections
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared outbound HTTP client, creating it on first use
+
+    Returns:
+        httpx.AsyncClient: Pooled client reused across services
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=HTTP_TIMEOUT,
+        )
+    return _http_client
+
+async def close_http_client():
+    """Close the shared HTTP client and its pooled connections"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("HTTP client closed")
+
+async def warmup_http_client(urls: Iterable[str], timeout: float = 3.0):
+    """
+    Open keep-alive connections to upstream APIs ahead of the first request
+
+    Args:
+        urls: Any URL on each host to pre-connect (the response is ignored)
+        timeout: Per-probe timeout so a slow upstream can't stall startup
+    """
+    urls = list(urls)
+    client = get_http_client()
+    results = await asyncio.gather(
+        *(client.head(url, timeout=timeout) for url in urls),
+        return_exceptions=True,
+    )
+    failed = [r for r in results if isinstance(r, Exception)]
+    if failed:
+        # URLs can embed API keys (Akismet), so only the error types are logged
+        logger.warning(f"HTTP warmup: {len(failed)}/{len(urls)} probes failed "
+                       f"({', '.join(type(e).__name__ for e in failed)})")
@@ -1,16 +1,30 @@
 from typing import Optional
-from redis.asyncio import Redis
+from redis.asyncio import Redis, ConnectionPool
 from ..core.config import settings
 import logging
 import json
 
 logger = logging.getLogger(__name__)
 
+# BLAKE3 import with fallback (SHA-256 is SHA-NI accelerated on modern x86)
+try:
+    from blake3 import blake3 as cache_key_hasher
+except ImportError:
+    from hashlib import sha256 as cache_key_hasher
+
+# Pool sizes: the shared pool serves caching/chat, the rate limiter gets its
+# own pool so bursts of cache traffic can't starve rate-limit checks
+REDIS_MAX_CONNECTIONS = 64
+RATE_LIMIT_MAX_CONNECTIONS = 32
+
 class RedisManager:
     """Redis connection manager for caching and real-time features"""
     
     def __init__(self):
         self.redis_client: Optional[Redis] = None
+        self.rate_limit_client: Optional[Redis] = None
+        self.pool: Optional[ConnectionPool] = None
+        self.rate_limit_pool: Optional[ConnectionPool] = None
     
     async def connect(self):
         """Initialize Redis connection"""
@@ -29,11 +43,25 @@ class RedisManager:
                 password_part = f":{settings.REDIS_PASSWORD}@" if settings.REDIS_PASSWORD else ""
                 redis_url = f"{protocol}://{password_part}{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
             
-            self.redis_client = Redis.from_url(
+            # RESP3 + explicitly sized pools; responses are parsed by hiredis
+            # when it is installed
+            self.pool = ConnectionPool.from_url(
                 redis_url,
+                max_connections=REDIS_MAX_CONNECTIONS,
                 decode_responses=True,
-                encoding="utf-8"
+                encoding="utf-8",
+                protocol=3
             )
+            self.redis_client = Redis(connection_pool=self.pool)
+            
+            # Rate-limit counters are plain integers, no need to decode them
+            self.rate_limit_pool = ConnectionPool.from_url(
+                redis_url,
+                max_connections=RATE_LIMIT_MAX_CONNECTIONS,
+                decode_responses=False,
+                protocol=3
+            )
+            self.rate_limit_client = Redis(connection_pool=self.rate_limit_pool)
             
             # Test connection
             await self.redis_client.ping()
@@ -42,16 +70,27 @@ class RedisManager:
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             self.redis_client = None
+            self.rate_limit_client = None
     
     async def disconnect(self):
-        """Close Redis connection"""
+        """Close Redis connections and their pools"""
         if self.redis_client:
             await self.redis_client.close()
-            logger.info("Redis connection closed")
+        if self.rate_limit_client:
+            await self.rate_limit_client.close()
+        if self.pool:
+            await self.pool.disconnect()
+        if self.rate_limit_pool:
+            await self.rate_limit_pool.disconnect()
+        logger.info("Redis connection closed")
     
     def get_client(self) -> Optional[Redis]:
         """Get Redis client instance"""
         return self.redis_client
+    
+    def get_rate_limit_client(self) -> Optional[Redis]:
+        """Get Redis client backed by the dedicated rate-limit pool"""
+        return self.rate_limit_client
 
 # Global Redis manager instance
 redis_manager = RedisManager()
@@ -165,10 +204,10 @@ class AICacheService:
     @staticmethod
     def generate_qa_cache_key(group_id: int, question: str, context_type: str = "full") -> str:
         """Generate cache key for Q&A"""
-        import hashlib
         normalized_question = question.lower().strip()
         cache_input = f"{group_id}:{normalized_question}:{context_type}"
-        return f"qa:{hashlib.md5(cache_input.encode()).hexdigest()}"
+        # qa2: prefix so entries keyed by the old MD5 digest are never read back
+        return f"qa2:{cache_key_hasher(cache_input.encode()).hexdigest()[:32]}"
     
     @staticmethod
     def generate_search_cache_key(group_id: int, query: str, limit: int) -> str:
@@ -1,26 +1,47 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 from .core.config import settings
+from .models.base import Base
 
 # Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    poolclass=StaticPool,
-    connect_args={
-        "check_same_thread": False,
-    } if "sqlite" in settings.DATABASE_URL else {},
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    pool_pre_ping=True,
-)
+if "sqlite" in settings.DATABASE_URL:
+    engine = create_engine(
+        settings.DATABASE_URL,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+else:
+    # Persistent pool so requests reuse warm connections instead of paying
+    # the TCP/TLS/auth handshake for every small lookup
+    engine = create_engine(
+        settings.DATABASE_URL,
+        poolclass=QueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    @event.listens_for(engine, "connect")
+    def _set_vector_search_params(dbapi_connection, connection_record):
+        """Tune pgvector ANN search breadth for HNSW and the remaining IVFFlat indexes"""
+        # Autocommit so the setting isn't discarded by the pool's reset-on-return rollback
+        existing_autocommit = dbapi_connection.autocommit
+        dbapi_connection.autocommit = True
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET SESSION hnsw.ef_search = {settings.HNSW_EF_SEARCH}")
+        cursor.execute(f"SET SESSION ivfflat.probes = {settings.IVFFLAT_PROBES}")
+        cursor.close()
+        dbapi_connection.autocommit = existing_autocommit
 
-# Create base class for models
-Base = declarative_base()
+# Create session factory
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+)
 
 def get_db():
     """Dependency to get database session"""
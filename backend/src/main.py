@@ -1,27 +1,30 @@
 from fastapi import FastAPI, Depends, HTTPException, status, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 import logging
 import os
 from typing import Optional, List, Dict, Any
 import asyncio
 import redis.asyncio as redis
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
 from pydantic import BaseModel, EmailStr, Field
 import httpx
-import hashlib
 from supabase import create_client, Client
 import stripe
 
 # Import services and middleware
 from .services.supabase_auth_service import SupabaseAuthService, get_auth_service
 from .services.ai_service import AIService
+from .services.akismet_service import get_akismet_service
 from .services.embedding_service import EmbeddingService
 from .services.chat_service import ChatService
 from .services.search_service import SearchService
 from .core.redis import redis_manager, get_redis
+from .core.http import close_http_client
+from .utils.watermark import watermark_digest
 from .api.v1.middleware.auth_middleware import AuthMiddleware, PremiumMiddleware, RateLimitMiddleware
 
 # Import API routers
@@ -140,11 +143,15 @@ async def startup_event():
     # Connect to Redis
     await redis_manager.connect()
     logger.info("Connected to Redis")
+    # Open TLS connections to upstream APIs before the first user request
+    await asyncio.gather(AIService.warmup(), get_akismet_service().warmup())
 
 async def shutdown_event():
     # Disconnect from Redis
     await redis_manager.disconnect()
     logger.info("Disconnected from Redis")
+    # Close the shared outbound HTTP client
+    await close_http_client()
 
 app.add_event_handler("startup", startup_event)
 app.add_event_handler("shutdown", shutdown_event)
@@ -161,6 +168,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON responses (group/post/comment lists)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 # Add security middleware
 app.add_middleware(
     AuthMiddleware,
@@ -187,7 +197,7 @@ app.add_middleware(
 
 app.add_middleware(
     RateLimitMiddleware,
-    redis_client=redis_manager.get_client(),
+    redis_client_factory=redis_manager.get_rate_limit_client,
     rate_limits={
         "default": 100,  # 100 requests per minute
         "search": 20,    # 20 search requests per minute
@@ -321,13 +331,14 @@ async def get_group_stats(group_id: str):
 async def create_post(post: PostCreate, background_tasks: BackgroundTasks):
     """Create a new post with auto-tagging"""
     try:
-        # Generate watermark hash
-        watermark_content = f"{post.content}{datetime.utcnow().isoformat()}"
-        watermark_hash = hashlib.md5(watermark_content.encode()).hexdigest()
-        
         # For now, set a default author_id (in real app, get from JWT token)
         author_id = "00000000-0000-0000-0000-000000000000"  # Default test user
         
+        # Same digest as Post.calculate_watermark_hash; PostgREST takes bytea as
+        # a JSON string, so the raw digest bytes travel as a \x hex literal
+        created_at = datetime.now(timezone.utc)
+        watermark_hash = "\\x" + watermark_digest(post.content, author_id, created_at).hex()
+        
         # Check user's daily post limit
         profile = supabase.table("profiles").select("*").eq("id", author_id).execute()
         if profile.data:
@@ -343,8 +354,7 @@ async def create_post(post: PostCreate, background_tasks: BackgroundTasks):
             "watermark_hash": watermark_hash,
             "upvotes": 0,
             "downvotes": 0,
-            "score": 0,
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": created_at.isoformat()
         }
         
         result = supabase.table("posts").insert(post_data).execute()
@@ -1,18 +1,25 @@
 """Database models for the application"""
 
 from .base import Base
-from .user import User, UserProfile, UserPresence
-from .group_message import GroupMessage
-from .post import Post, Comment, PostTag, Tag
-from .notification import Notification
-from .search import SearchResult, SearchRequest
-from .ai_chat import AIChatRequest, AIChatResponse, ChatMessageRequest, ChatMessageResponse
-from .community import Community
-from .country import Country
+
+# SQLAlchemy models - each class is defined (and mapped) in exactly one module
+from .user import User
+from .group_message import GroupMessage, GroupMessageLike, MessageReadReceipt, UserPresence
+from .post import Post
+from .post_tag import PostTag
+from .comment import Comment
+from .notification import Notification, PostLike, CommentLike
+from .search import SearchQuery, SearchSuggestion, TrendingTopic
+from .ai_chat import ChatSession, ChatMessage, ChatContext, ChatFeedback
+from .community import Community, CommunityMember
+from .country import Country, VisaType, VisaRequirement
+
+# Pydantic API models
 from .visa_models import (
     UserProfile as VisaUserProfile,
     Group,
     Post as VisaPost,
+    PostEmbedding as VisaPostEmbedding,
     Comment as VisaComment,
     Tag as VisaTag,
     PostTag as VisaPostTag,
@@ -39,29 +46,36 @@ __all__ = [
     # Base
     "Base",
     
-    # Original models
+    # Database models
     "User",
-    "UserProfile", 
-    "UserPresence",
     "GroupMessage",
+    "GroupMessageLike",
+    "MessageReadReceipt",
+    "UserPresence",
     "Post",
-    "Comment", 
     "PostTag",
-    "Tag",
+    "Comment",
     "Notification",
-    "SearchResult",
-    "SearchRequest",
-    "AIChatRequest",
-    "AIChatResponse",
-    "ChatMessageRequest",
-    "ChatMessageResponse",
+    "PostLike",
+    "CommentLike",
+    "SearchQuery",
+    "SearchSuggestion",
+    "TrendingTopic",
+    "ChatSession",
+    "ChatMessage",
+    "ChatContext",
+    "ChatFeedback",
     "Community",
+    "CommunityMember",
     "Country",
+    "VisaType",
+    "VisaRequirement",
     
     # Visa-specific models
     "VisaUserProfile",
     "Group",
     "VisaPost",
+    "VisaPostEmbedding",
     "VisaComment",
     "VisaTag",
     "VisaPostTag", 
@@ -1,28 +1,43 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, func, Index, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Index, text
 from sqlalchemy.orm import relationship
-from .base import Base, TimestampMixin
+from sqlalchemy.dialects.postgresql import JSONB
+from enum import Enum
+from .base import Base, TimestampMixin, pg_enum
+
+class MessageRole(str, Enum):
+    USER = "user"
+    ASSISTANT = "assistant"
+    SYSTEM = "system"
+
+class MessageContentType(str, Enum):
+    TEXT = "text"
+    IMAGE = "image"
+    FILE = "file"
 
 class ChatSession(Base, TimestampMixin):
     """Model for AI chat sessions"""
     __tablename__ = "chat_sessions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # Null for anonymous
     session_id = Column(String(100), unique=True, index=True, nullable=False)
     title = Column(String(200))  # Auto-generated title from first message
     is_active = Column(Boolean, default=True)
-    metadata = Column(JSON)  # Additional session metadata
+    session_metadata = Column("metadata", JSONB)  # Additional session metadata; "metadata" is reserved on declarative models
     
     # Relationships
     user = relationship("User")
-    messages = relationship("ChatMessage", back_populates="session", cascade="all, delete-orphan")
+    messages = relationship("ChatMessage", back_populates="session", cascade="all, delete-orphan", lazy="selectin")
     
     # Indexes for performance
     __table_args__ = (
         Index('idx_chat_sessions_user_id', 'user_id'),
-        Index('idx_chat_sessions_session_id', 'session_id'),
         Index('idx_chat_sessions_is_active', 'is_active'),
         Index('idx_chat_sessions_created_at', 'created_at'),
+        Index('idx_chat_sessions_user_active', 'user_id', 'created_at',
+              postgresql_where=text('is_active')),
+        Index('idx_chat_sessions_metadata_gin', 'metadata', postgresql_using='gin',
+              postgresql_ops={'metadata': 'jsonb_path_ops'}),
     )
     
     def __repr__(self):
@@ -32,21 +47,22 @@ class ChatMessage(Base, TimestampMixin):
     """Model for individual chat messages"""
     __tablename__ = "chat_messages"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     session_id = Column(Integer, ForeignKey("chat_sessions.id"), nullable=False)
-    role = Column(String(20), nullable=False)  # user, assistant, system
+    role = Column(pg_enum(MessageRole, "message_role"), nullable=False)
     content = Column(Text, nullable=False)
-    content_type = Column(String(20), default="text")  # text, image, file
-    message_metadata = Column(JSON)  # Additional message metadata
+    content_type = Column(pg_enum(MessageContentType, "message_content_type"), default=MessageContentType.TEXT)
+    message_metadata = Column(JSONB)  # Additional message metadata
     
     # Relationships
     session = relationship("ChatSession", back_populates="messages")
     
     # Indexes for performance
     __table_args__ = (
-        Index('idx_chat_messages_session_id', 'session_id'),
         Index('idx_chat_messages_role', 'role'),
-        Index('idx_chat_messages_created_at', 'created_at'),
+        Index('idx_chat_messages_session_created', 'session_id', 'created_at', 'id'),
+        Index('idx_chat_messages_metadata_gin', 'message_metadata', postgresql_using='gin',
+              postgresql_ops={'message_metadata': 'jsonb_path_ops'}),
     )
     
     def __repr__(self):
@@ -56,17 +72,19 @@ class ChatContext(Base, TimestampMixin):
     """Model for chat context and knowledge base"""
     __tablename__ = "chat_context"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     context_key = Column(String(100), unique=True, index=True, nullable=False)
-    context_data = Column(JSON, nullable=False)  # Context information
+    context_data = Column(JSONB, nullable=False)  # Context information
     expires_at = Column(DateTime, nullable=True)  # Optional expiration
     is_persistent = Column(Boolean, default=False)  # Whether to persist across sessions
     
     # Indexes for performance
     __table_args__ = (
-        Index('idx_chat_context_context_key', 'context_key'),
         Index('idx_chat_context_expires_at', 'expires_at'),
         Index('idx_chat_context_is_persistent', 'is_persistent'),
+        # Lookups filter on the owning user only, so index that key instead of the whole blob
+        Index('idx_chat_context_user_gin', text("(context_data -> 'user_id') jsonb_path_ops"),
+              postgresql_using='gin'),
     )
     
     def __repr__(self):
@@ -76,7 +94,7 @@ class ChatFeedback(Base, TimestampMixin):
     """Model for chat feedback and ratings"""
     __tablename__ = "chat_feedback"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     session_id = Column(Integer, ForeignKey("chat_sessions.id"), nullable=False)
     message_id = Column(Integer, ForeignKey("chat_messages.id"), nullable=True)
     rating = Column(Integer)  # 1-5 star rating
@@ -1,8 +1,17 @@
-from sqlalchemy import Column, Integer, DateTime, func
+from sqlalchemy import Column, Integer, DateTime, Enum as SAEnum, func
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
 
+def pg_enum(enum_cls, name: str) -> SAEnum:
+    """Native PostgreSQL ENUM type that stores the enum values (not member names)"""
+    return SAEnum(
+        enum_cls,
+        name=name,
+        native_enum=True,
+        values_callable=lambda members: [member.value for member in members]
+    )
+
 class TimestampMixin:
     """Mixin for adding timestamp fields to models"""
     created_at = Column(DateTime, default=func.now(), nullable=False)
@@ -1,20 +1,26 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Index
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import TSVECTOR
-from .base import Base, TimestampMixin
+from enum import Enum
+from .base import Base, TimestampMixin, pg_enum
+
+class CommentStatus(str, Enum):
+    PUBLISHED = "published"
+    EDITED = "edited"
+    DELETED = "deleted"
 
 class Comment(Base, TimestampMixin):
     """Comment model for post discussions and chat messages"""
     __tablename__ = "comments"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     content = Column(Text, nullable=False)
     content_html = Column(Text)  # HTML version of content
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     post_id = Column(Integer, ForeignKey("posts.id"), nullable=True)  # Null for chat messages
     community_id = Column(Integer, ForeignKey("communities.id"), nullable=False)
     parent_id = Column(Integer, ForeignKey("comments.id"), nullable=True)  # For nested comments
-    status = Column(String(20), default="published")  # published, edited, deleted
+    status = Column(pg_enum(CommentStatus, "comment_status"), default=CommentStatus.PUBLISHED)
     is_chat_message = Column(Boolean, default=False)  # True for chat messages
     message_type = Column(String(20), default="text")  # text, image, file
     like_count = Column(Integer, default=0)
@@ -24,17 +30,25 @@ class Comment(Base, TimestampMixin):
     author = relationship("User", back_populates="comments")
     post = relationship("Post", back_populates="comments")
     community = relationship("Community", back_populates="comments")
-    parent = relationship("Comment", remote_side=[id], backref="replies")
+    parent = relationship("Comment", remote_side=[id], back_populates="replies")
+    replies = relationship("Comment", back_populates="parent", lazy="selectin")
     likes = relationship("CommentLike", back_populates="comment", cascade="all, delete-orphan")
     
     # Indexes for performance
     __table_args__ = (
         Index('idx_comments_post_id', 'post_id'),
         Index('idx_comments_author_id', 'author_id'),
-        Index('idx_comments_community_id', 'community_id'),
         Index('idx_comments_parent_id', 'parent_id'),
         Index('idx_comments_is_chat_message', 'is_chat_message'),
         Index('idx_comments_created_at', 'created_at'),
+        Index('idx_comments_search_vector', 'search_vector', postgresql_using='gin'),
+        # Feeds never show soft-deleted comments, keep them out of the index
+        Index('idx_comments_post_active', 'post_id', 'created_at', 'id',
+              postgresql_where=text("status <> 'deleted'")),
+        # Covering index for community feeds/chat history (index-only scans)
+        Index('idx_comments_feed', 'community_id', text('created_at DESC'), text('id DESC'),
+              postgresql_include=['author_id', 'like_count'],
+              postgresql_where=text("status <> 'deleted'")),
     )
     
     def __repr__(self):
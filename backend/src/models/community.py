@@ -1,13 +1,19 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Index
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import TSVECTOR
-from .base import Base, TimestampMixin
+from enum import Enum
+from .base import Base, TimestampMixin, pg_enum
+
+class CommunityMemberRole(str, Enum):
+    MEMBER = "member"
+    MODERATOR = "moderator"
+    ADMIN = "admin"
 
 class Community(Base, TimestampMixin):
     """Community model for organizing discussions by country/topic"""
     __tablename__ = "communities"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
     description = Column(Text)
     description_html = Column(Text)  # HTML version of description
@@ -26,14 +32,19 @@ class Community(Base, TimestampMixin):
     posts = relationship("Post", back_populates="community", cascade="all, delete-orphan")
     comments = relationship("Comment", back_populates="community", cascade="all, delete-orphan")
     members = relationship("CommunityMember", back_populates="community", cascade="all, delete-orphan")
-    moderators = relationship("CommunityModerator", back_populates="community", cascade="all, delete-orphan")
+    moderators = relationship(
+        "CommunityMember",
+        primaryjoin="and_(Community.id == CommunityMember.community_id, "
+                    "CommunityMember.role.in_(['moderator', 'admin']))",
+        viewonly=True
+    )
     
     # Indexes for performance
     __table_args__ = (
         Index('idx_communities_country', 'country'),
-        Index('idx_communities_slug', 'slug'),
         Index('idx_communities_is_public', 'is_public'),
         Index('idx_communities_created_at', 'created_at'),
+        Index('idx_communities_search_vector', 'search_vector', postgresql_using='gin'),
     )
     
     def __repr__(self):
@@ -43,48 +54,31 @@ class CommunityMember(Base, TimestampMixin):
     """Association model for community membership"""
     __tablename__ = "community_members"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     community_id = Column(Integer, ForeignKey("communities.id"), nullable=False)
-    role = Column(String(20), default="member")  # member, moderator, admin
-    joined_at = Column(DateTime, default=func.now())
+    role = Column(pg_enum(CommunityMemberRole, "community_member_role"), default=CommunityMemberRole.MEMBER)
+    joined_at = Column(DateTime(timezone=True), server_default=func.now())
     is_active = Column(Boolean, default=True)
+    permissions = Column(String(200))  # Comma-separated moderator permissions
+    appointed_by = Column(Integer, ForeignKey("users.id"))  # Who promoted this member to moderator/admin
+    appointed_at = Column(DateTime(timezone=True))
     
     # Relationships
-    user = relationship("User", back_populates="communities")
+    user = relationship("User", foreign_keys=[user_id], back_populates="communities")
     community = relationship("Community", back_populates="members")
+    appointed_by_user = relationship("User", foreign_keys=[appointed_by])
     
     # Indexes for performance
     __table_args__ = (
         Index('idx_community_members_user_id', 'user_id'),
         Index('idx_community_members_community_id', 'community_id'),
         Index('idx_community_members_role', 'role'),
+        Index('idx_community_members_joined_at', 'joined_at'),
+        # Moderator lookups only touch the handful of privileged rows
+        Index('idx_community_members_moderators', 'community_id', 'user_id',
+              postgresql_where=text("role IN ('moderator', 'admin')")),
     )
     
     def __repr__(self):
-        return f"<CommunityMember(user_id={self.user_id}, community_id={self.community_id}, role='{self.role}')>"
-
-class CommunityModerator(Base, TimestampMixin):
-    """Association model for community moderation"""
-    __tablename__ = "community_moderators"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    community_id = Column(Integer, ForeignKey("communities.id"), nullable=False)
-    permissions = Column(String(200))  # Comma-separated permissions
-    appointed_by = Column(Integer, ForeignKey("users.id"))  # Who appointed this moderator
-    appointed_at = Column(DateTime, default=func.now())
-    
-    # Relationships
-    user = relationship("User", foreign_keys=[user_id])
-    community = relationship("Community", back_populates="moderators")
-    appointed_by_user = relationship("User", foreign_keys=[appointed_by])
-    
-    # Indexes for performance
-    __table_args__ = (
-        Index('idx_community_moderators_user_id', 'user_id'),
-        Index('idx_community_moderators_community_id', 'community_id'),
-    )
-    
-    def __repr__(self):
-        return f"<CommunityModerator(user_id={self.user_id}, community_id={self.community_id})>"
\ No newline at end of file
+        return f"<CommunityMember(user_id={self.user_id}, community_id={self.community_id}, role='{self.role}')>"
\ No newline at end of file
@@ -1,21 +1,22 @@
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, func, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from .base import Base, TimestampMixin
 
 class Country(Base, TimestampMixin):
     """Model for country-specific information and settings"""
     __tablename__ = "countries"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     code = Column(String(10), unique=True, index=True, nullable=False)  # usa, canada, uk, australia
     name = Column(String(100), nullable=False)
     display_name = Column(String(100), nullable=False)
     flag_emoji = Column(String(10))  # Country flag emoji
-    visa_types = Column(Text)  # JSON array of available visa types
-    popular_cities = Column(Text)  # JSON array of popular cities
+    visa_types = Column(ARRAY(String(50)))  # Available visa type codes
+    popular_cities = Column(ARRAY(String(100)))  # Popular cities
     requirements_url = Column(String(500))  # Link to official visa requirements
     processing_time = Column(String(100))  # Typical processing time
-    fees_info = Column(Text)  # JSON with fee information
+    fees_info = Column(JSONB)  # Fee information
     is_active = Column(Boolean, default=True)
     
     # Relationships
@@ -23,9 +24,9 @@ class Country(Base, TimestampMixin):
     
     # Indexes for performance
     __table_args__ = (
-        Index('idx_countries_code', 'code'),
         Index('idx_countries_name', 'name'),
         Index('idx_countries_is_active', 'is_active'),
+        Index('idx_countries_visa_types_gin', 'visa_types', postgresql_using='gin'),
     )
     
     def __repr__(self):
@@ -35,16 +36,16 @@ class VisaType(Base, TimestampMixin):
     """Model for different visa types within countries"""
     __tablename__ = "visa_types"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     country_code = Column(String(10), nullable=False)  # Foreign key to countries.code
     type_code = Column(String(50), nullable=False)  # h1b, f1, tourist, etc.
     display_name = Column(String(100), nullable=False)
     description = Column(Text)
-    eligibility_criteria = Column(Text)  # JSON with criteria
-    required_documents = Column(Text)  # JSON with document list
+    eligibility_criteria = Column(JSONB)  # Eligibility criteria
+    required_documents = Column(JSONB)  # Document list
     processing_time = Column(String(100))
-    fees = Column(Text)  # JSON with fee breakdown
-    restrictions = Column(Text)  # JSON with restrictions
+    fees = Column(JSONB)  # Fee breakdown
+    restrictions = Column(JSONB)  # Restrictions
     is_active = Column(Boolean, default=True)
     
     # Indexes for performance
@@ -61,7 +62,7 @@ class VisaRequirement(Base, TimestampMixin):
     """Model for specific visa requirements and checklists"""
     __tablename__ = "visa_requirements"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     visa_type_id = Column(Integer, nullable=False)  # Foreign key to visa_types.id
     requirement_type = Column(String(50), nullable=False)  # document, fee, test, etc.
     description = Column(Text, nullable=False)
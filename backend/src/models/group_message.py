@@ -1,13 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Index
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Index, BigInteger, Identity
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import TSVECTOR, VECTOR
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from pgvector.sqlalchemy import HALFVEC
 from .base import Base, TimestampMixin
 
 class GroupMessage(Base, TimestampMixin):
     """Group message model for chat functionality"""
     __tablename__ = "group_messages"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     content = Column(Text, nullable=False)
     content_html = Column(Text)  # HTML version of content
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -16,7 +17,7 @@ class GroupMessage(Base, TimestampMixin):
     status = Column(String(20), default="published")  # published, edited, deleted
     like_count = Column(Integer, default=0)
     search_vector = Column(TSVECTOR)  # Full-text search vector
-    content_embedding = Column(VECTOR(1536))  # pgvector embedding for semantic search
+    content_embedding = Column(HALFVEC(1536))  # pgvector half-precision embedding for semantic search
     
     # Relationships
     user = relationship("User", back_populates="group_messages")
@@ -30,7 +31,9 @@ class GroupMessage(Base, TimestampMixin):
         Index('idx_group_messages_created_at', 'created_at'),
         Index('idx_group_messages_status', 'status'),
         Index('idx_group_messages_search_vector', 'search_vector', postgresql_using='gin'),
-        Index('idx_group_messages_content_embedding', 'content_embedding', postgresql_using='ivfflat'),
+        Index('idx_group_messages_content_embedding', 'content_embedding', postgresql_using='hnsw',
+              postgresql_ops={'content_embedding': 'halfvec_cosine_ops'},
+              postgresql_with={'m': 24, 'ef_construction': 128}),
     )
     
     def __repr__(self):
@@ -40,9 +43,9 @@ class GroupMessageLike(Base, TimestampMixin):
     """Association model for group message likes"""
     __tablename__ = "group_message_likes"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    message_id = Column(Integer, ForeignKey("group_messages.id"), nullable=False)
+    message_id = Column(BigInteger, ForeignKey("group_messages.id"), nullable=False)
     created_at = Column(DateTime, default=func.now())
     
     # Relationships
@@ -61,10 +64,9 @@ class MessageReadReceipt(Base, TimestampMixin):
     """Read receipts for group messages"""
     __tablename__ = "message_read_receipts"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    group_id = Column(Integer, ForeignKey("communities.id"), nullable=False)
-    message_id = Column(Integer, ForeignKey("group_messages.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    group_id = Column(Integer, ForeignKey("communities.id"), primary_key=True)
+    message_id = Column(BigInteger, ForeignKey("group_messages.id"), primary_key=True)
     read_at = Column(DateTime, default=func.now())
     
     # Relationships
@@ -72,11 +74,6 @@ class MessageReadReceipt(Base, TimestampMixin):
     group = relationship("Community")
     message = relationship("GroupMessage")
     
-    # Unique constraint
-    __table_args__ = (
-        Index('idx_message_read_receipts_user_group_message', 'user_id', 'group_id', 'message_id', unique=True),
-    )
-    
     def __repr__(self):
         return f"<MessageReadReceipt(user_id={self.user_id}, group_id={self.group_id}, message_id={self.message_id})>"
 
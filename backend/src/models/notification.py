@@ -1,29 +1,33 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Index
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Index, text, BigInteger, Identity
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from .base import Base, TimestampMixin
 
 class Notification(Base, TimestampMixin):
     """Notification model for user notifications"""
     __tablename__ = "notifications"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     type = Column(String(50), nullable=False)  # comment_reply, post_mention, community_invite, etc.
     title = Column(String(200), nullable=False)
     message = Column(Text, nullable=False)
     is_read = Column(Boolean, default=False)
-    read_at = Column(DateTime, nullable=True)
+    read_at = Column(DateTime(timezone=True), nullable=True)
     action_url = Column(String(500))  # URL to navigate to when clicked
-    metadata = Column(Text)  # JSON string for additional data
+    extra_data = Column("data", JSONB)  # Additional payload; "metadata" is reserved on declarative models
     
     # Relationships
     user = relationship("User", back_populates="notifications")
     
     # Indexes for performance
     __table_args__ = (
-        Index('idx_notifications_user_id', 'user_id'),
-        Index('idx_notifications_is_read', 'is_read'),
+        # Covering index for the per-user notification feed (index-only scans);
+        # the (user_id, is_read = false) prefix also serves unread counts
+        Index('idx_notifications_user_unread_feed', 'user_id', 'is_read', text('created_at DESC'),
+              postgresql_include=['type', 'title']),
         Index('idx_notifications_type', 'type'),
+        Index('idx_notifications_read_at', 'read_at'),
         Index('idx_notifications_created_at', 'created_at'),
     )
     
@@ -34,9 +38,9 @@ class PostLike(Base, TimestampMixin):
     """Association model for post likes"""
     __tablename__ = "post_likes"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    post_id = Column(Integer, ForeignKey("posts.id"), nullable=False)
+    post_id = Column(UUID(as_uuid=True), ForeignKey("posts.id"), nullable=False)
     created_at = Column(DateTime, default=func.now())
     
     # Relationships
@@ -45,8 +49,7 @@ class PostLike(Base, TimestampMixin):
     
     # Indexes for performance
     __table_args__ = (
-        Index('idx_post_likes_user_id', 'user_id'),
-        Index('idx_post_likes_post_id', 'post_id'),
+        Index('idx_post_likes_post_created', 'post_id', 'created_at'),
         Index('idx_post_likes_unique', 'user_id', 'post_id', unique=True),
     )
     
@@ -57,7 +60,7 @@ class CommentLike(Base, TimestampMixin):
     """Association model for comment likes"""
     __tablename__ = "comment_likes"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     comment_id = Column(Integer, ForeignKey("comments.id"), nullable=False)
     created_at = Column(DateTime, default=func.now())
@@ -68,8 +71,7 @@ class CommentLike(Base, TimestampMixin):
     
     # Indexes for performance
     __table_args__ = (
-        Index('idx_comment_likes_user_id', 'user_id'),
-        Index('idx_comment_likes_comment_id', 'comment_id'),
+        Index('idx_comment_likes_comment_created', 'comment_id', 'created_at'),
         Index('idx_comment_likes_unique', 'user_id', 'comment_id', unique=True),
     )
     
@@ -1,28 +1,32 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, Index
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import TSVECTOR, UUID, ARRAY
-from sqlalchemy.types import Float
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Boolean, DateTime, ForeignKey, func, Index, text, Computed, LargeBinary
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy import case
 from .base import Base, TimestampMixin
-from ..utils.watermark import generate_watermark_hash, generate_display_watermark
+from ..utils.watermark import watermark_digest
 
 class Post(Base, TimestampMixin):
     """Post model for visa Q&A discussions"""
     __tablename__ = "posts"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True)
     group_id = Column(UUID(as_uuid=True), ForeignKey("groups.id"), nullable=False)
     country_id = Column(Integer, ForeignKey("countries.id"), nullable=True)  # Optional, can be set based on content
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     title = Column(String(500), nullable=True)  # Optional for chat messages
     content = Column(Text, nullable=False)
     content_html = Column(Text)  # HTML version of content
-    embedding = Column(ARRAY(Float), nullable=True)  # Vector embedding for semantic search
+    embedding = deferred(Column(HALFVEC(1536), nullable=True))  # pgvector half-precision embedding for semantic search; loaded on access only
     upvotes = Column(Integer, default=0)
     downvotes = Column(Integer, default=0)
-    score = Column(Integer, default=0)  # Generated: upvotes - downvotes
-    watermark_hash = Column(String(64), nullable=True)  # MD5 hash for DMCA tracking
-    display_watermark = Column(String(50), nullable=True)  # User-friendly watermark like POST-xxxxx-epoch
+    score = Column(Integer, Computed("upvotes - downvotes", persisted=True))
+    watermark_hash = Column(LargeBinary(32), nullable=True)  # Raw BLAKE3/SHA-256 digest for DMCA tracking
+    watermark_epoch = Column(BigInteger, server_default=text("extract(epoch from now())::bigint"))
+    display_watermark = Column(
+        String(50),
+        Computed("'POST-' || substr(id::text, 1, 8) || '-' || watermark_epoch::text", persisted=True),
+    )  # User-friendly watermark like POST-xxxxx-epoch
     status = Column(String(20), default="published")  # published, draft, archived, deleted
     is_pinned = Column(Boolean, default=False)
     is_locked = Column(Boolean, default=False)
@@ -36,45 +40,29 @@ class Post(Base, TimestampMixin):
     country = relationship("Country", back_populates="posts")
     comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
     post_tags = relationship("PostTag", back_populates="post", cascade="all, delete-orphan")
+    likes = relationship("PostLike", back_populates="post", cascade="all, delete-orphan")
     
     # Composite index for performance
     __table_args__ = (
-        Index('idx_posts_group_id', 'group_id'),
         Index('idx_posts_author_id', 'author_id'),
         Index('idx_posts_country_id', 'country_id'),
         Index('idx_posts_status', 'status'),
         Index('idx_posts_created_at', 'created_at'),
         Index('idx_posts_score', 'score'),
+        Index('idx_posts_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('idx_posts_embedding', 'embedding',
+              postgresql_using='hnsw',
+              postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+              postgresql_with={'m': 24, 'ef_construction': 128}),
+        # Covering index for group feeds (index-only scans)
+        Index('idx_posts_feed', 'group_id', text('created_at DESC'), 'id',
+              postgresql_include=['author_id', 'score'],
+              postgresql_where=text("status <> 'deleted'")),
     )
     
-    @property
-    def net_score(self):
-        """Calculate net score (upvotes - downvotes)"""
-        return self.upvotes - self.downvotes
-    
     def calculate_watermark_hash(self):
         """Generate watermark hash for DMCA tracking"""
-        import hashlib
-        content_to_hash = f"{self.content}{self.author_id}{self.created_at.isoformat()}"
-        self.watermark_hash = hashlib.md5(content_to_hash.encode()).hexdigest()
-    
-    def update_score(self):
-        """Update score based on upvotes and downvotes"""
-        self.score = self.net_score
-    
-    def generate_display_watermark(self):
-        """Generate user-friendly display watermark like POST-xxxxx-epoch"""
-        import time
-        from datetime import datetime
-        epoch = int(time.time())
-        # Extract first 4 chars of UUID for uniqueness
-        uuid_part = str(self.id)[:8] if self.id else "0000"
-        self.display_watermark = f"POST-{uuid_part}-{epoch}"
-    
-    def generate_all_watermarks(self):
-        """Generate both watermark hash and display watermark"""
-        self.calculate_watermark_hash()
-        self.generate_display_watermark()
+        self.watermark_hash = watermark_digest(self.content, self.author_id, self.created_at)
     
     def __repr__(self):
         return f"<Post(id={self.id}, group_id={self.group_id}, author_id={self.author_id}, score={self.score})>"
\ No newline at end of file
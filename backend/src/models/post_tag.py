@@ -1,12 +1,13 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID
 from .base import Base, TimestampMixin
 
 class PostTag(Base, TimestampMixin):
     """Many-to-many relationship between posts and tags"""
     __tablename__ = "post_tags"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     post_id = Column(UUID(as_uuid=True), ForeignKey("posts.id"), nullable=False)
     tag_id = Column(Integer, ForeignKey("tags.id"), nullable=False)
     confidence = Column(String(5), default="auto")  # 'auto', 'manual', confidence score
@@ -15,10 +16,11 @@ class PostTag(Base, TimestampMixin):
     post = relationship("Post", back_populates="post_tags")
     tag = relationship("Tag", back_populates="post_tags")
     
-    # Composite primary key to prevent duplicates
+    # Surrogate id PK; the unique (post_id, tag_id) index prevents duplicates
     __table_args__ = (
-        Index('idx_post_tags_post_id', 'post_id'),
-        Index('idx_post_tags_tag_id', 'tag_id'),
+        Index('idx_post_tags_unique', 'post_id', 'tag_id', unique=True),
+        # "Posts tagged X" lookups are served from the index alone
+        Index('idx_post_tags_tag_post', 'tag_id', 'post_id'),
     )
     
     def __repr__(self):
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, func, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, func, Index, BigInteger, Identity
 from sqlalchemy.orm import relationship
 from .base import Base, TimestampMixin
 
@@ -6,13 +6,13 @@ class SearchQuery(Base, TimestampMixin):
     """Model to track search queries for analytics and suggestions"""
     __tablename__ = "search_queries"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     query = Column(String(200), nullable=False)
     country = Column(String(50))  # Optional country filter
     search_type = Column(String(50))  # posts, comments, communities, all
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # Optional
     result_count = Column(Integer, default=0)
-    search_time = Column(Integer)  # Time taken for search in milliseconds
+    search_duration_us = Column(BigInteger)  # Time taken for search in microseconds
     
     # Relationships
     user = relationship("User")
@@ -32,7 +32,7 @@ class SearchSuggestion(Base, TimestampMixin):
     """Model for search suggestions and autocomplete"""
     __tablename__ = "search_suggestions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     suggestion = Column(String(200), nullable=False)
     country = Column(String(50))  # Optional country filter
     suggestion_type = Column(String(50))  # popular_query, trending_topic, related_term
@@ -42,6 +42,10 @@ class SearchSuggestion(Base, TimestampMixin):
     # Indexes for performance
     __table_args__ = (
         Index('idx_search_suggestions_suggestion', 'suggestion'),
+        # Trigram index for autocomplete (ILIKE prefix/substring and `<->` similarity)
+        Index('idx_search_suggestions_trgm', 'suggestion',
+              postgresql_using='gin',
+              postgresql_ops={'suggestion': 'gin_trgm_ops'}),
         Index('idx_search_suggestions_country', 'country'),
         Index('idx_search_suggestions_suggestion_type', 'suggestion_type'),
         Index('idx_search_suggestions_weight', 'weight'),
@@ -55,7 +59,7 @@ class TrendingTopic(Base, TimestampMixin):
     """Model for trending topics and discussions"""
     __tablename__ = "trending_topics"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     topic = Column(String(200), nullable=False)
     country = Column(String(50), nullable=False)
     score = Column(Integer, default=0)  # Calculated trending score
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, func, Index
 from sqlalchemy.orm import relationship
 from .base import Base, TimestampMixin
 
@@ -6,7 +6,7 @@ class User(Base, TimestampMixin):
     """User model for authentication and profile management"""
     __tablename__ = "users"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     username = Column(String(50), unique=True, index=True, nullable=False)
     email = Column(String(100), unique=True, index=True, nullable=False)
     full_name = Column(String(100))
@@ -20,8 +20,18 @@ class User(Base, TimestampMixin):
     # Relationships
     posts = relationship("Post", back_populates="author", cascade="all, delete-orphan")
     comments = relationship("Comment", back_populates="author", cascade="all, delete-orphan")
-    communities = relationship("CommunityMember", back_populates="user", cascade="all, delete-orphan")
+    communities = relationship("CommunityMember", foreign_keys="CommunityMember.user_id", back_populates="user", cascade="all, delete-orphan")
     notifications = relationship("Notification", back_populates="user", cascade="all, delete-orphan")
     
+    # Trigram indexes so user search (ILIKE '%query%') doesn't seq-scan
+    __table_args__ = (
+        Index('idx_users_username_trgm', 'username',
+              postgresql_using='gin',
+              postgresql_ops={'username': 'gin_trgm_ops'}),
+        Index('idx_users_full_name_trgm', 'full_name',
+              postgresql_using='gin',
+              postgresql_ops={'full_name': 'gin_trgm_ops'}),
+    )
+    
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', email='{self.email}')>"
\ No newline at end of file
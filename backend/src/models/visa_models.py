@@ -2,11 +2,16 @@
 
 from typing import Optional, List, Dict, Any
 from uuid import UUID, uuid4
-from datetime import datetime
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
+def utc_now() -> datetime:
+    """Timezone-aware current UTC time (datetime.utcnow is naive and deprecated)"""
+    return datetime.now(timezone.utc)
+
+
 # Enums
 class UserRole(str, Enum):
     USER = "user"
@@ -48,11 +53,10 @@ class UserProfile(BaseModel):
     total_upvotes: int = 0
     reputation_score: int = 0
     stripe_customer_id: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Group(BaseModel):
@@ -66,11 +70,10 @@ class Group(BaseModel):
     user_count: int = 0
     active_count: int = 0
     is_public: bool = True
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Post(BaseModel):
@@ -80,7 +83,6 @@ class Post(BaseModel):
     author_id: UUID
     title: str
     content: str
-    content_embedding: Optional[List[float]] = None
     status: PostStatus = PostStatus.ACTIVE
     upvotes: int = 0
     downvotes: int = 0
@@ -90,12 +92,19 @@ class Post(BaseModel):
     is_answered: bool = False
     accepted_answer_id: Optional[UUID] = None
     watermark_hash: str
-    metadata: Dict[str, Any] = {}
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+    created_at: datetime = Field(default_factory=utc_now)
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PostEmbedding(BaseModel):
+    """Post embedding, kept apart from Post so listings don't carry the vector"""
+    post_id: UUID
+    embedding: List[float]
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Comment(BaseModel):
@@ -108,11 +117,10 @@ class Comment(BaseModel):
     upvotes: int = 0
     score: int = 0
     is_accepted: bool = False
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Tag(BaseModel):
@@ -125,32 +133,29 @@ class Tag(BaseModel):
     color: Optional[str] = None
     usage_count: int = 0
     is_moderator_only: bool = False
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PostTag(BaseModel):
     """Many-to-many relationship between posts and tags"""
     post_id: UUID
     tag_id: int
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserPresence(BaseModel):
     """Real-time user presence tracking"""
     user_id: UUID
     group_id: UUID
-    last_seen: datetime = Field(default_factory=datetime.utcnow)
+    last_seen: datetime = Field(default_factory=utc_now)
     is_active: bool = True
     device_info: Optional[Dict[str, Any]] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GroupMessage(BaseModel):
@@ -162,10 +167,9 @@ class GroupMessage(BaseModel):
     message_type: str = "text"  # text, image, file, etc.
     reply_to_id: Optional[UUID] = None
     edited_at: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Search and Analytics Models
@@ -182,6 +186,8 @@ class SearchResult(BaseModel):
     text_score: float
     upvotes: int
     created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AutoTaggingResult(BaseModel):
@@ -199,10 +205,10 @@ class AnalyticsEvent(BaseModel):
     event_name: str
     user_id: Optional[UUID] = None
     group_id: Optional[UUID] = None
-    properties: Dict[str, Any] = {}
+    properties: Dict[str, Any] = Field(default_factory=dict)
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 # API Request/Response Models
@@ -224,6 +230,8 @@ class ChatMessageResponse(BaseModel):
     message_type: str
     created_at: datetime
     is_edited: bool
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PostCreateRequest(BaseModel):
@@ -251,6 +259,8 @@ class PostResponse(BaseModel):
     is_answered: bool
     created_at: datetime
     updated_at: Optional[datetime]
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SearchRequest(BaseModel):
@@ -17,19 +17,31 @@ import asyncio
 import sys
 import os
 import argparse
+import hashlib
 import logging
+import socket
+import sqlite3
 import time
-from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+
+import httpx
+import numpy as np
+
+# orjson import with fallback (embedding payloads are large float arrays)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text, bindparam, Integer, String
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from pgvector.psycopg2 import register_vector
 from config.settings import settings
 
 # Configure logging
@@ -39,16 +51,149 @@ logging.basicConfig(
 )
 logger = logging.getLogger('embedding_worker')
 
+MAX_EMBED_WORDS = 500
+
+
+def clean_embedding_text(text: str) -> str:
+    """Collapse whitespace and keep the first MAX_EMBED_WORDS words"""
+    # maxsplit stops tokenising once the limit is reached instead of splitting the whole post
+    return ' '.join(str(text).split(None, MAX_EMBED_WORDS)[:MAX_EMBED_WORDS])
+
+
+class EmbeddingCache:
+    """Content-addressed on-disk cache of text embeddings, stored as float16"""
+    
+    # Stay under SQLite's bound-parameter limit on older builds
+    _LOOKUP_CHUNK = 500
+    
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                text_hash BLOB NOT NULL,
+                embedding BLOB NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            ) WITHOUT ROWID
+        """)
+    
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.sha256(text.encode('utf-8')).digest()
+    
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """Look up cached embeddings; None for texts that are not cached"""
+        keys = [self._key(text) for text in texts]
+        found = {}
+        for i in range(0, len(keys), self._LOOKUP_CHUNK):
+            chunk = keys[i:i + self._LOOKUP_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            found.update(self._conn.execute(
+                f"SELECT text_hash, embedding FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                [model, *chunk]
+            ))
+        return [
+            np.frombuffer(found[key], dtype=np.float16).astype(np.float32).tolist() if key in found else None
+            for key in keys
+        ]
+    
+    def put_many(self, model: str, items: List[tuple]):
+        """Store (text, embedding) pairs"""
+        rows = [(model, self._key(text), np.asarray(embedding, dtype=np.float16).tobytes()) for text, embedding in items]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, embedding) VALUES (?, ?, ?)",
+                rows
+            )
+
 
 class EmbeddingWorker:
     """Background worker for processing embedding jobs"""
     
+    # Hot statements are built once per process rather than per batch
+    _CLAIM_JOBS_SQL = text("""
+        WITH claimable AS (
+            SELECT ej.id, p.title, p.short_excerpt
+            FROM embedding_jobs ej
+            JOIN posts p ON ej.post_id = p.id
+            WHERE ej.processed = false
+            AND ej.claimed_at IS NULL
+            AND ej.retry_count < :max_retries
+            AND (ej.error IS NULL OR ej.retry_count < 2)
+            AND btrim(coalesce(p.title, '') || coalesce(p.short_excerpt, '')) <> ''
+            ORDER BY ej.created_at ASC
+            LIMIT :limit
+            FOR UPDATE OF ej SKIP LOCKED
+        )
+        UPDATE embedding_jobs
+        SET claimed_at = now(), claimed_by = :worker_id
+        FROM claimable
+        WHERE embedding_jobs.id = claimable.id
+        RETURNING embedding_jobs.id AS job_id, embedding_jobs.post_id, claimable.title, claimable.short_excerpt
+    """).bindparams(
+        bindparam('max_retries', type_=Integer),
+        bindparam('limit', type_=Integer),
+        bindparam('worker_id', type_=String)
+    )
+    
+    # Jobs whose post has nothing to embed are closed out before claiming.
+    # Empty jobs are never claimed, so claimed_at IS NULL loses nothing and
+    # lets the scan use the embedding_jobs_pending_idx partial index
+    _SKIP_EMPTY_SQL = text("""
+        UPDATE embedding_jobs
+        SET processed = true, processed_at = now(), error = 'empty_text'
+        WHERE id IN (
+            SELECT ej.id
+            FROM embedding_jobs ej
+            JOIN posts p ON ej.post_id = p.id
+            WHERE ej.processed = false
+            AND ej.claimed_at IS NULL
+            AND btrim(coalesce(p.title, '') || coalesce(p.short_excerpt, '')) = ''
+            LIMIT 1000
+        )
+    """)
+    
+    _REAP_CLAIMS_SQL = text("""
+        UPDATE embedding_jobs
+        SET claimed_at = NULL, claimed_by = NULL
+        WHERE processed = false
+        AND claimed_at < now() - make_interval(mins => :stale_after_minutes)
+    """).bindparams(
+        bindparam('stale_after_minutes', type_=Integer)
+    )
+    
+    _UPDATE_POSTS_SQL = text("""
+        UPDATE posts
+        SET embedding = v.embedding, updated_at = now()
+        FROM unnest(CAST(:post_ids AS uuid[]), CAST(:embeddings AS halfvec[])) AS v(post_id, embedding)
+        WHERE posts.id = v.post_id
+    """)
+    
+    _MARK_PROCESSED_SQL = text("""
+        UPDATE embedding_jobs
+        SET processed = true, processed_at = now()
+        WHERE id = ANY(:job_ids)
+    """)
+    
+    _MARK_FAILED_SQL = text("""
+        UPDATE embedding_jobs
+        SET error = v.error, retry_count = retry_count + 1,
+            claimed_at = NULL, claimed_by = NULL
+        FROM unnest(CAST(:job_ids AS bigint[]), CAST(:errors AS text[])) AS v(job_id, error)
+        WHERE embedding_jobs.id = v.job_id
+    """)
+    
     def __init__(
         self,
         batch_size: int = 100,
         max_retries: int = 3,
         ollama_base_url: str = None,
-        embedding_model: str = None
+        embedding_model: str = None,
+        ollama_concurrency: int = None,
+        cache_path: Optional[str] = None,
+        single_run: bool = False
     ):
         self.batch_size = batch_size
         self.max_retries = max_retries
@@ -56,14 +201,34 @@ class EmbeddingWorker:
         # Ollama settings
         self.ollama_base_url = ollama_base_url or getattr(settings, 'OLLAMA_BASE_URL', 'http://localhost:11434')
         self.embedding_model = embedding_model or getattr(settings, 'OLLAMA_EMBEDDING_MODEL', 'nomic-embed-text')
+        self.ollama_concurrency = ollama_concurrency or getattr(settings, 'OLLAMA_CONCURRENCY', 4)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
         
         # Database setup
         database_url = getattr(settings, 'SUPABASE_DATABASE_URL', None) or \
                        getattr(settings, 'DATABASE_URL', 'postgresql://localhost/visa')
         
-        self.engine = create_engine(database_url, pool_pre_ping=True)
+        if single_run:
+            # One batch and exit: nothing to keep pooled
+            self.engine = create_engine(database_url, poolclass=NullPool)
+        else:
+            # Serial batch loop needs a single long-lived connection; TCP keepalives
+            # replace the per-checkout pre-ping round trip
+            self.engine = create_engine(
+                database_url,
+                pool_size=1,
+                max_overflow=0,
+                pool_recycle=300,
+                pool_pre_ping=False,
+                connect_args={'keepalives': 1, 'keepalives_idle': 30}
+            )
+        # Adapt numpy arrays to pgvector on every new DBAPI connection
+        event.listen(self.engine, "connect", lambda dbapi_connection, _: register_vector(dbapi_connection))
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         
+        # Local embedding cache so re-queued posts skip Ollama
+        self.embedding_cache = EmbeddingCache(cache_path) if cache_path else None
+        
         # HTTP session for Ollama
         self._http_session = None
         
@@ -90,64 +255,112 @@ class EmbeddingWorker:
             logger.warning(f"Ollama not available: {e}")
             return False
     
-    def generate_embedding(self, text: str) -> Optional[List[float]]:
-        """Generate embedding for text content using Ollama"""
+    def generate_embeddings_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Generate embeddings for texts already passed through clean_embedding_text"""
+        if not texts:
+            return []
+        
         try:
-            import requests
-            
-            # Clean text - limit to reasonable length
-            cleaned_text = ' '.join(str(text).split()[:500])
+            if self.embedding_cache is None:
+                return asyncio.run(self._gather_embeddings(texts))
             
-            session = self._get_http_session()
-            response = session.post(
-                f"{self.ollama_base_url}/api/embeddings",
-                json={
-                    "model": self.embedding_model,
-                    "prompt": cleaned_text
-                },
-                timeout=60
-            )
+            embeddings = self.embedding_cache.get_many(self.embedding_model, texts)
+            misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+            if misses:
+                logger.info(f"Embedding cache: {len(texts) - len(misses)} hits, {len(misses)} misses")
+                fresh = asyncio.run(self._gather_embeddings([texts[i] for i in misses]))
+                for i, embedding in zip(misses, fresh):
+                    embeddings[i] = embedding
+                self.embedding_cache.put_many(
+                    self.embedding_model,
+                    [(texts[i], embeddings[i]) for i in misses if embeddings[i]]
+                )
+            return embeddings
+        except Exception as e:
+            logger.error(f"Failed to generate batch embeddings: {e}")
+            return [None] * len(texts)
+    
+    async def _gather_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Split texts into one /api/embed request per concurrency slot and gather them"""
+        semaphore = asyncio.Semaphore(self.ollama_concurrency)
+        limits = httpx.Limits(
+            max_connections=self.ollama_concurrency,
+            max_keepalive_connections=self.ollama_concurrency,
+            keepalive_expiry=60
+        )
+        chunk_size = max(1, -(-len(texts) // self.ollama_concurrency))
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        
+        async with httpx.AsyncClient(timeout=120, limits=limits) as client:
+            results = await asyncio.gather(*[self._aembed(client, semaphore, chunk) for chunk in chunks])
             
-            if response.status_code == 200:
-                result = response.json()
-                embedding = result.get('embedding')
-                if embedding:
-                    return embedding
-                else:
-                    logger.error(f"Unexpected Ollama response: {result}")
+            if any(result is None for result in results):
+                # Older Ollama servers only expose the per-prompt /api/embeddings endpoint
+                logger.info("Ollama /api/embed not available, falling back to per-text requests")
+                return list(await asyncio.gather(*[self._aembed_legacy(client, semaphore, text) for text in texts]))
+        
+        return [embedding for result in results for embedding in result]
+    
+    async def _aembed(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, texts: List[str]) -> Optional[List[Optional[List[float]]]]:
+        """Embed a chunk of texts with one /api/embed request; None if the endpoint is missing"""
+        async with semaphore:
+            try:
+                response = await client.post(
+                    f"{self.ollama_base_url}/api/embed",
+                    json={
+                        "model": self.embedding_model,
+                        "input": texts
+                    }
+                )
+                
+                if response.status_code == 200:
+                    embeddings = json_loads(response.content).get('embeddings')
+                    if embeddings and len(embeddings) == len(texts):
+                        return embeddings
+                    logger.error(f"Unexpected Ollama batch response for {len(texts)} texts")
+                elif response.status_code == 404:
                     return None
-            else:
-                logger.error(f"Ollama embedding failed: {response.status_code} - {response.text}")
-                return None
+                else:
+                    logger.error(f"Ollama batch embedding failed: {response.status_code} - {response.text}")
+                    
+            except Exception as e:
+                logger.error(f"Failed to generate embeddings for {len(texts)} texts: {e}")
+            
+            return [None] * len(texts)
+    
+    async def _aembed_legacy(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, text: str) -> Optional[List[float]]:
+        """Embed a single text with the legacy /api/embeddings endpoint"""
+        async with semaphore:
+            try:
+                response = await client.post(
+                    f"{self.ollama_base_url}/api/embeddings",
+                    json={
+                        "model": self.embedding_model,
+                        "prompt": text
+                    }
+                )
                 
-        except Exception as e:
-            logger.error(f"Failed to generate embedding: {e}")
+                if response.status_code == 200:
+                    embedding = json_loads(response.content).get('embedding')
+                    if embedding:
+                        return embedding
+                    logger.error("Unexpected Ollama response without embedding")
+                else:
+                    logger.error(f"Ollama embedding failed: {response.status_code} - {response.text}")
+                    
+            except Exception as e:
+                logger.error(f"Failed to generate embedding: {e}")
+            
             return None
     
-    def generate_embeddings_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
-        """Generate embeddings for multiple texts"""
-        embeddings = []
-        for text in texts:
-            embedding = self.generate_embedding(text)
-            embeddings.append(embedding)
-        return embeddings
-    
     def fetch_pending_jobs(self, session, limit: int = 100) -> List[Dict]:
-        """Fetch pending embedding jobs from the database"""
+        """Claim pending embedding jobs so concurrent workers never share a job"""
         try:
-            query = text("""
-                SELECT ej.id as job_id, ej.post_id, p.title, p.short_excerpt
-                FROM embedding_jobs ej
-                JOIN posts p ON ej.post_id = p.id
-                WHERE ej.processed = false
-                AND ej.retry_count < :max_retries
-                AND (ej.error IS NULL OR ej.retry_count < 2)
-                ORDER BY ej.created_at ASC
-                LIMIT :limit
-            """)
-            
-            result = session.execute(query, {'max_retries': self.max_retries, 'limit': limit})
-            rows = result.fetchall()
+            claimed = session.execute(self._CLAIM_JOBS_SQL, {
+                'max_retries': self.max_retries,
+                'limit': limit,
+                'worker_id': self.worker_id
+            }).fetchall()
             
             return [
                 {
@@ -156,96 +369,119 @@ class EmbeddingWorker:
                     'title': row.title,
                     'short_excerpt': row.short_excerpt
                 }
-                for row in rows
+                for row in claimed
             ]
             
         except Exception as e:
             logger.error(f"Failed to fetch pending jobs: {e}")
             return []
     
-    def process_jobs(self, jobs: List[Dict]) -> tuple:
+    def reap_stale_claims(self, session, stale_after_minutes: int = 10) -> int:
+        """Release claims left behind by workers that died mid-batch"""
+        try:
+            result = session.execute(self._REAP_CLAIMS_SQL, {'stale_after_minutes': stale_after_minutes})
+            if result.rowcount:
+                logger.info(f"Released {result.rowcount} stale embedding job claims")
+            return result.rowcount
+        except Exception as e:
+            logger.error(f"Failed to reap stale claims: {e}")
+            return 0
+    
+    def skip_empty_jobs(self, session) -> int:
+        """Mark jobs for posts with no title or excerpt as processed without embedding"""
+        try:
+            result = session.execute(self._SKIP_EMPTY_SQL)
+            if result.rowcount:
+                logger.info(f"Skipped {result.rowcount} embedding jobs with no text")
+            return result.rowcount
+        except Exception as e:
+            logger.error(f"Failed to skip empty jobs: {e}")
+            return 0
+    
+    def process_jobs(self, session, jobs: List[Dict]) -> tuple:
         """Process a batch of embedding jobs"""
-        processed_count = 0
-        failed_count = 0
-        
+        # Collect texts for the whole batch so Ollama is called once, and
+        # group jobs by cleaned text so duplicate inputs are embedded once
+        jobs_by_text: Dict[str, List[Dict]] = {}
         for job in jobs:
-            try:
-                # Combine title and short_excerpt for embedding
-                combined_text = f"{job['title'] or ''}\n\n{job['short_excerpt'] or ''}"
-                combined_text = combined_text.strip()
-                
-                if not combined_text:
-                    logger.warning(f"Job {job['job_id']}: No text to embed, skipping")
-                    continue
-                
-                # Generate embedding
-                embedding = self.generate_embedding(combined_text)
-                
+            # Combine title and short_excerpt for embedding (empty posts are filtered in SQL)
+            combined_text = f"{job['title'] or ''}\n\n{job['short_excerpt'] or ''}"
+            cleaned_text = clean_embedding_text(combined_text)
+            jobs_by_text.setdefault(cleaned_text, []).append(job)
+        
+        unique_texts = list(jobs_by_text)
+        # No statements run on the session here, so no transaction is open
+        embeddings = self.generate_embeddings_batch(unique_texts)
+        
+        succeeded = []
+        failed = []
+        for cleaned_text, embedding in zip(unique_texts, embeddings):
+            for job in jobs_by_text[cleaned_text]:
                 if embedding:
-                    # Update post embedding
-                    update_query = text("""
-                        UPDATE posts 
-                        SET embedding = :embedding::vector, updated_at = now()
-                        WHERE id = :post_id
-                    """)
-                    
-                    self.engine.execute(update_query, {
-                        'embedding': str(embedding),
-                        'post_id': job['post_id']
-                    })
-                    
-                    # Mark job as processed
-                    mark_processed_query = text("""
-                        UPDATE embedding_jobs 
-                        SET processed = true, processed_at = now()
-                        WHERE id = :job_id
-                    """)
-                    
-                    self.engine.execute(mark_processed_query, {'job_id': job['job_id']})
-                    
-                    processed_count += 1
-                    logger.info(f"Processed job {job['job_id']} for post {job['post_id']}")
+                    succeeded.append((job, embedding))
                 else:
-                    # Mark as failed with error
-                    self._mark_job_failed(session=None, job_id=job['job_id'], error="Embedding generation failed")
-                    failed_count += 1
-                    
+                    failed.append((job['job_id'], "Embedding generation failed"))
+        
+        if succeeded:
+            try:
+                # Savepoint so a failed write can still record failures in this transaction
+                with session.begin_nested():
+                    self._store_embeddings(session, succeeded)
+                logger.info(f"Stored embeddings for {len(succeeded)} posts")
             except Exception as e:
-                logger.error(f"Failed to process job {job['job_id']}: {e}")
-                self._mark_job_failed(session=None, job_id=job['job_id'], error=str(e))
-                failed_count += 1
+                logger.error(f"Failed to store embeddings for {len(succeeded)} jobs: {e}")
+                failed.extend((job['job_id'], str(e)) for job, _ in succeeded)
+                succeeded = []
+        
+        if failed:
+            self._mark_jobs_failed(session, failed)
+        
+        return len(succeeded), len(failed)
+    
+    def _store_embeddings(self, session, results: List[tuple]):
+        """Write embeddings and mark their jobs processed with one statement each"""
+        # Update post embeddings
+        session.execute(self._UPDATE_POSTS_SQL, {
+            'post_ids': [str(job['post_id']) for job, _ in results],
+            'embeddings': [np.asarray(embedding, dtype=np.float32) for _, embedding in results]
+        })
         
-        return processed_count, failed_count
+        # Mark jobs as processed
+        session.execute(self._MARK_PROCESSED_SQL, {'job_ids': [job['job_id'] for job, _ in results]})
     
-    def _mark_job_failed(self, session, job_id: int, error: str):
-        """Mark a job as failed and increment retry count"""
+    def _mark_jobs_failed(self, session, failures: List[tuple]):
+        """Mark jobs as failed and increment their retry counts"""
         try:
-            query = text("""
-                UPDATE embedding_jobs 
-                SET error = :error, retry_count = retry_count + 1
-                WHERE id = :job_id
-            """)
-            self.engine.execute(query, {'error': error[:500], 'job_id': job_id})
+            session.execute(self._MARK_FAILED_SQL, {
+                'job_ids': [job_id for job_id, _ in failures],
+                'errors': [error[:500] for _, error in failures]
+            })
         except Exception as e:
-            logger.error(f"Failed to mark job {job_id} as failed: {e}")
+            logger.error(f"Failed to mark {len(failures)} jobs as failed: {e}")
     
     def run_batch(self) -> Dict[str, int]:
         """Run one batch of embedding job processing"""
         session = self.SessionLocal()
         try:
-            # Fetch pending jobs
+            self.reap_stale_claims(session)
+            self.skip_empty_jobs(session)
+            
+            # Claim pending jobs
             jobs = self.fetch_pending_jobs(session, self.batch_size)
             
+            # Commit the claim on its own so the row locks are released before the
+            # Ollama calls and claimed_at is visible to other workers' reapers
+            session.commit()
+            
             if not jobs:
                 logger.debug("No pending embedding jobs found")
                 return {'processed': 0, 'failed': 0, 'total': 0}
             
             logger.info(f"Found {len(jobs)} pending embedding jobs")
             
-            # Process jobs
-            processed_count, failed_count = self.process_jobs(jobs)
-            
-            # Commit all changes
+            # Embeddings are generated outside any transaction; the writes then
+            # run in a second, short transaction
+            processed_count, failed_count = self.process_jobs(session, jobs)
             session.commit()
             
             return {
@@ -293,6 +529,11 @@ def main():
     parser.add_argument('--once', action='store_true', help='Run only one batch and exit')
     parser.add_argument('--ollama-url', type=str, default=None, help='Ollama base URL')
     parser.add_argument('--model', type=str, default=None, help='Embedding model name')
+    parser.add_argument('--concurrency', type=int, default=None, help='Concurrent Ollama requests')
+    parser.add_argument('--cache-path', type=str,
+                        default=getattr(settings, 'EMBEDDING_CACHE_PATH', None) or str(PROJECT_ROOT / '.cache' / 'embedding_cache.sqlite3'),
+                        help='SQLite file for the local embedding cache')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the local embedding cache')
     
     args = parser.parse_args()
     
@@ -300,7 +541,10 @@ def main():
         batch_size=args.batch_size,
         max_retries=args.max_retries,
         ollama_base_url=args.ollama_url,
-        embedding_model=args.model
+        embedding_model=args.model,
+        ollama_concurrency=args.concurrency,
+        cache_path=None if args.no_cache else args.cache_path,
+        single_run=args.once
     )
     
     if args.once:
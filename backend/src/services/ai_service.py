@@ -1,10 +1,12 @@
 from typing import List, Dict, Any, Optional
 import logging
 import json
-import hashlib
 from datetime import datetime, timedelta
+import httpx
 from redis.asyncio import Redis
 from ..core.config import settings
+from ..core.http import get_http_client, warmup_http_client
+from ..core.redis import AICacheService
 from ..services.embedding_service import EmbeddingService
 
 logger = logging.getLogger(__name__)
@@ -17,11 +19,19 @@ class AIService:
         self.embedding_service = embedding_service
         self.cache_ttl = 3600  # 1 hour default TTL
     
+    @staticmethod
+    async def warmup():
+        """Pre-connect the shared HTTP client to the configured LLM providers"""
+        urls = []
+        if settings.GROQ_API_KEY:
+            urls.append("https://api.groq.com/")
+        if settings.OPENROUTER_API_KEY:
+            urls.append("https://openrouter.ai/")
+        await warmup_http_client(urls)
+    
     def _generate_cache_key(self, group_id: int, question: str, context_type: str = "full") -> str:
-        """Generate cache key for question-answer pairs"""
-        normalized_question = question.lower().strip()
-        cache_input = f"{group_id}:{normalized_question}:{context_type}"
-        return f"qa:{hashlib.md5(cache_input.encode()).hexdigest()}"
+        """Generate cache key for question-answer pairs (shared with OptimizedAIService)"""
+        return AICacheService.generate_qa_cache_key(group_id, question, context_type)
     
     async def get_cached_answer(self, group_id: int, question: str, context_type: str = "full") -> Optional[Dict[str, Any]]:
         """Get cached answer for a question"""
@@ -64,18 +74,28 @@ class AIService:
     ) -> List[Dict[str, Any]]:
         """Search for relevant content using semantic search"""
         try:
-            # Perform semantic search across posts, comments, and messages
-            posts = await self.embedding_service.semantic_search_posts(
-                question, community_id, top_k
-            )
-            
-            comments = await self.embedding_service.semantic_search_comments(
-                question, community_id, top_k
-            )
-            
-            messages = await self.embedding_service.semantic_search_messages(
-                question, group_id, top_k
+            # Embed the question once and share it across all three searches
+            query_embedding = self.embedding_service.generate_embedding(question)
+            if not query_embedding:
+                return []
+            
+            # The searches share one synchronous Session, so run them one after
+            # another; one failing source shouldn't drop the results of the others
+            searches = (
+                ('posts', self.embedding_service.semantic_search_posts, community_id),
+                ('comments', self.embedding_service.semantic_search_comments, community_id),
+                ('messages', self.embedding_service.semantic_search_messages, group_id),
             )
+            results = {}
+            for source, search, scope_id in searches:
+                try:
+                    results[source] = await search(
+                        question, scope_id, top_k, query_embedding=query_embedding
+                    )
+                except Exception as e:
+                    logger.error(f"Semantic search on {source} failed: {e}")
+                    results[source] = []
+            posts, comments, messages = results['posts'], results['comments'], results['messages']
             
             # Combine and rank results
             all_results = []
@@ -164,8 +184,6 @@ class AIService:
     ) -> Optional[str]:
         """Call Groq API for text generation"""
         try:
-            import httpx
-            
             if not settings.GROQ_API_KEY:
                 logger.error("Groq API key not configured")
                 return None
@@ -190,20 +208,19 @@ class AIService:
             }
             
             # Make the API call
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.groq.com/openai/v1/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
+            response = await get_http_client().post(
+                "https://api.groq.com/openai/v1/chat/completions",
+                headers=headers,
+                json=payload
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                return data["choices"][0]["message"]["content"].strip()
+            else:
+                logger.error(f"Groq API error: {response.status_code} - {response.text}")
+                return None
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data["choices"][0]["message"]["content"].strip()
-                else:
-                    logger.error(f"Groq API error: {response.status_code} - {response.text}")
-                    return None
-                    
         except httpx.TimeoutException:
             logger.error("Groq API timeout")
             return None
@@ -220,8 +237,6 @@ class AIService:
     ) -> Optional[str]:
         """Call OpenRouter API for text generation"""
         try:
-            import httpx
-            
             if not settings.OPENROUTER_API_KEY:
                 logger.error("OpenRouter API key not configured")
                 return None
@@ -248,20 +263,19 @@ class AIService:
             }
             
             # Make the API call
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
+            response = await get_http_client().post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers=headers,
+                json=payload
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                return data["choices"][0]["message"]["content"].strip()
+            else:
+                logger.error(f"OpenRouter API error: {response.status_code} - {response.text}")
+                return None
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data["choices"][0]["message"]["content"].strip()
-                else:
-                    logger.error(f"OpenRouter API error: {response.status_code} - {response.text}")
-                    return None
-                    
         except httpx.TimeoutException:
             logger.error("OpenRouter API timeout")
             return None
@@ -4,6 +4,7 @@ import logging
 import httpx
 from typing import Dict, Any, Optional
 from ..core.config import settings
+from ..core.http import get_http_client, warmup_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,11 @@ class AkismetService:
         self.blog_url = settings.AKISMET_BLOG_URL
         self.enabled = settings.AKISMET_ENABLED and self.api_key
         
+    async def warmup(self):
+        """Pre-connect the shared HTTP client to the Akismet endpoint"""
+        if self.enabled:
+            await warmup_http_client([f"https://{self.api_key}.rest.akismet.com/"])
+    
     async def check_spam(
         self,
         content: str,
@@ -44,8 +50,7 @@ class AkismetService:
                 "comment_type": "forum-post"
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(api_url, data=data)
+            response = await get_http_client().post(api_url, data=data, timeout=10.0)
                 
             if response.status_code == 200:
                 is_spam = response.text.lower() == "true"
@@ -85,8 +90,7 @@ class AkismetService:
                 "comment_type": "forum-post"
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(api_url, data=data)
+            response = await get_http_client().post(api_url, data=data, timeout=10.0)
                 
             return response.status_code == 200
             
@@ -118,8 +122,7 @@ class AkismetService:
                 "comment_type": "forum-post"
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(api_url, data=data)
+            response = await get_http_client().post(api_url, data=data, timeout=10.0)
                 
             return response.status_code == 200
             
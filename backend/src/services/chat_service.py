@@ -1,4 +1,5 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import text, func, and_, or_
 from ..models.post import Post
@@ -22,26 +23,42 @@ class ChatService:
         self, 
         community_id: int, 
         limit: int = 50, 
-        offset: int = 0
+        offset: int = 0,
+        before: Optional[Tuple[datetime, int]] = None
     ) -> List[Dict[str, Any]]:
-        """Get chat history for a community"""
+        """Get chat history for a community
+        
+        When ``before`` (created_at, id) is given, seeks past that row instead
+        of using OFFSET so deep pages cost the same as the first one.
+        """
         try:
-            query = text("""
+            params = {
+                'community_id': community_id,
+                'limit': limit
+            }
+            
+            if before:
+                page_clause = "AND (c.created_at, c.id) < (:before_created_at, :before_id)"
+                limit_clause = "LIMIT :limit"
+                params.update({'before_created_at': before[0], 'before_id': before[1]})
+            else:
+                page_clause = ""
+                limit_clause = "LIMIT :limit OFFSET :offset"
+                params['offset'] = offset
+            
+            query = text(f"""
                 SELECT c.*, u.username, u.avatar_url
                 FROM comments c
                 JOIN users u ON c.user_id = u.id
                 WHERE c.community_id = :community_id
                 AND c.is_chat_message = true
                 AND c.status = 'published'
-                ORDER BY c.created_at DESC
-                LIMIT :limit OFFSET :offset
+                {page_clause}
+                ORDER BY c.created_at DESC, c.id DESC
+                {limit_clause}
             """)
             
-            results = self.db.execute(query, {
-                'community_id': community_id,
-                'limit': limit,
-                'offset': offset
-            }).fetchall()
+            results = self.db.execute(query, params).fetchall()
 
             return [dict(row) for row in results]
 
@@ -234,7 +251,6 @@ class ChatService:
     ) -> Dict[str, Any]:
         """Search chat messages in a community"""
         try:
-            search_query = text("""
             search_query = text("""
                 SELECT c.*, u.username, u.avatar_url
                 FROM comments c
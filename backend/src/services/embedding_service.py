@@ -92,7 +92,7 @@ class EmbeddingService:
     def _clean_text(self, text: str) -> str:
         """Clean text for embedding generation"""
         # Remove excessive whitespace and normalize
-        return ' '.join(text.split()[:500])  # Limit to 500 tokens
+        return ' '.join(text.split(None, 500)[:500])  # Limit to 500 tokens
     
     async def update_post_embeddings(self, post_id: int) -> bool:
         """Update embeddings for a specific post"""
@@ -182,7 +182,7 @@ class EmbeddingService:
                 # Update embedding in database
                 update_query = text("""
                     UPDATE group_messages 
-                    SET content_embedding = :embedding::vector
+                    SET content_embedding = :embedding::halfvec
                     WHERE id = :message_id
                 """)
                 
@@ -204,12 +204,14 @@ class EmbeddingService:
         self, 
         query: str, 
         community_id: Optional[int] = None,
-        limit: int = 10
+        limit: int = 10,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """Semantic search across posts"""
         try:
-            # Generate query embedding
-            query_embedding = self.generate_embedding(query)
+            # Generate query embedding unless the caller already has one
+            if query_embedding is None:
+                query_embedding = self.generate_embedding(query)
             
             if not query_embedding:
                 return []
@@ -246,12 +248,14 @@ class EmbeddingService:
         self, 
         query: str, 
         community_id: Optional[int] = None,
-        limit: int = 10
+        limit: int = 10,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """Semantic search across comments"""
         try:
-            # Generate query embedding
-            query_embedding = self.generate_embedding(query)
+            # Generate query embedding unless the caller already has one
+            if query_embedding is None:
+                query_embedding = self.generate_embedding(query)
             
             if not query_embedding:
                 return []
@@ -288,12 +292,14 @@ class EmbeddingService:
         self, 
         query: str, 
         group_id: int,
-        limit: int = 10
+        limit: int = 10,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """Semantic search across group messages"""
         try:
-            # Generate query embedding
-            query_embedding = self.generate_embedding(query)
+            # Generate query embedding unless the caller already has one
+            if query_embedding is None:
+                query_embedding = self.generate_embedding(query)
             
             if not query_embedding:
                 return []
@@ -301,7 +307,7 @@ class EmbeddingService:
             # Build search query
             search_query = text("""
                 SELECT gm.id, gm.content, gm.user_id, gm.group_id, gm.created_at,
-                       (content_embedding <=> :query_embedding::vector) as distance
+                       (content_embedding <=> :query_embedding::halfvec) as distance
                 FROM group_messages gm
                 WHERE gm.group_id = :group_id
                 AND content_embedding IS NOT NULL
@@ -388,7 +394,7 @@ class EmbeddingService:
                         gm.user_id as author_id,
                         gm.group_id as community_id,
                         gm.created_at,
-                        (gm.content_embedding <=> :query_embedding::vector) as semantic_score,
+                        (gm.content_embedding <=> :query_embedding::halfvec) as semantic_score,
                         ts_rank(gm.search_vector, plainto_tsquery('english', :query)) as keyword_score
                     FROM group_messages gm
                     WHERE gm.group_id = :group_id
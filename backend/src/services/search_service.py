@@ -92,7 +92,7 @@ class SearchService:
                 FROM comments c
                 JOIN posts p ON c.post_id = p.id
                 WHERE c.status = 'published'
-                AND to_tsvector('english', c.content) @@ plainto_tsquery('english', :query)
+                AND c.search_vector @@ plainto_tsquery('english', :query)
                 AND c.content ILIKE :like_query
             """)
             
@@ -116,7 +116,7 @@ class SearchService:
                 FROM comments c
                 JOIN posts p ON c.post_id = p.id
                 WHERE c.status = 'published'
-                AND to_tsvector('english', c.content) @@ plainto_tsquery('english', :query)
+                AND c.search_vector @@ plainto_tsquery('english', :query)
                 AND c.content ILIKE :like_query
             """)
             
@@ -146,14 +146,12 @@ class SearchService:
         try:
             search_query = text("""
                 SELECT c.*, 
-                       COUNT(p.id) as post_count,
-                       COUNT(DISTINCT cm.user_id) as member_count
+                       COUNT(p.id) as post_count
                 FROM communities c
                 LEFT JOIN posts p ON c.id = p.community_id AND p.status = 'published'
-                LEFT JOIN community_members cm ON c.id = cm.community_id
                 WHERE c.country = :country
                 AND (
-                    to_tsvector('english', c.name || ' ' || c.description) @@ plainto_tsquery('english', :query)
+                    c.search_vector @@ plainto_tsquery('english', :query)
                     OR c.name ILIKE :like_query
                     OR c.description ILIKE :like_query
                 )
@@ -177,7 +175,7 @@ class SearchService:
                 FROM communities c
                 WHERE c.country = :country
                 AND (
-                    to_tsvector('english', c.name || ' ' || c.description) @@ plainto_tsquery('english', :query)
+                    c.search_vector @@ plainto_tsquery('english', :query)
                     OR c.name ILIKE :like_query
                     OR c.description ILIKE :like_query
                 )
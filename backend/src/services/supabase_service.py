@@ -1,4 +1,5 @@
 from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
 from supabase import create_client, Client
 from ..core.config import settings
 import logging
@@ -87,10 +88,14 @@ class SupabaseService:
             data = {
                 'user_id': user_id,
                 'group_id': group_id,
-                'message_id': message_id
+                'message_id': message_id,
+                'read_at': datetime.now(timezone.utc).isoformat()
             }
             
-            self.supabase.table('message_read_receipts').upsert(data).execute()
+            # Single INSERT ... ON CONFLICT DO UPDATE on the composite key
+            self.supabase.table('message_read_receipts').upsert(
+                data, on_conflict='user_id,group_id,message_id'
+            ).execute()
             return True
             
         except Exception as e:
@@ -147,7 +152,9 @@ class SupabaseService:
                 'last_seen': 'NOW()'
             }
             
-            self.supabase.table('user_presence').upsert(data).execute()
+            self.supabase.table('user_presence').upsert(
+                data, on_conflict='user_id,group_id'
+            ).execute()
             return True
             
         except Exception as e:
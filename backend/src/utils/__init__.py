@@ -4,20 +4,12 @@ Utility modules for the visa Q&A application.
 Provides shared functionality for watermarking, validation, and common operations.
 """
 
-from .watermark import (
-    generate_post_watermarks,
-    generate_comment_watermarks,
-    generate_display_watermark,
-    generate_legal_watermark,
-    verify_watermark,
-    parse_display_watermark
-)
+from .watermark import ContentWatermarker, watermark_digest
+from .pagination import encode_cursor, decode_cursor
 
 __all__ = [
-    "generate_post_watermarks",
-    "generate_comment_watermarks", 
-    "generate_display_watermark",
-    "generate_legal_watermark",
-    "verify_watermark",
-    "parse_display_watermark"
-]
\ No newline at end of file
+    "ContentWatermarker",
+    "watermark_digest",
+    "encode_cursor",
+    "decode_cursor"
+]
@@ -0,0 +1,40 @@
+import base64
+import logging
+from typing import Optional, Tuple
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+_CURSOR_SEPARATOR = "|"
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Encode a keyset pagination cursor
+
+    Args:
+        created_at: Timestamp of the last row on the current page
+        row_id: ID of the last row on the current page
+
+    Returns:
+        str: Opaque URL-safe cursor
+    """
+    raw = f"{created_at.isoformat()}{_CURSOR_SEPARATOR}{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    """
+    Decode a keyset pagination cursor
+
+    Args:
+        cursor: Cursor produced by encode_cursor
+
+    Returns:
+        Optional[Tuple[datetime, int]]: (created_at, id) or None if invalid
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, row_id = raw.rsplit(_CURSOR_SEPARATOR, 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        logger.warning(f"Invalid pagination cursor: {e}")
+        return None
@@ -3,10 +3,36 @@ import time
 import re
 import logging
 from typing import Dict, Any, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def watermark_digest(content: str, author_id: Any, created_at: datetime) -> bytes:
+    """
+    Compute the raw 32-byte digest stored in posts.watermark_hash
+
+    Always SHA-256 so any host, and every write path, can recompute and
+    verify a stored hash.
+
+    Args:
+        content: Post content
+        author_id: Author ID (int or UUID; hashed via its str form)
+        created_at: Post creation time (naive values are taken as UTC)
+
+    Returns:
+        bytes: SHA-256 digest
+    """
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    # Integer microseconds so the stored timestamptz round-trips exactly,
+    # whatever ISO form the database hands back
+    epoch_us = (created_at - _EPOCH) // timedelta(microseconds=1)
+    hasher = hashlib.sha256(content.encode('utf-8', 'surrogatepass'))
+    hasher.update(b"\x00%s\x00%d" % (str(author_id).encode('utf-8'), epoch_us))
+    return hasher.digest()
+
 class ContentWatermarker:
     """Utility for watermarking and verifying content"""
     
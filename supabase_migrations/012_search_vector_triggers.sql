@@ -0,0 +1,20 @@
+-- Keep search_vector columns in sync on write and GIN-index them
+-- so `search_vector @@ plainto_tsquery(...)` no longer seq-scans
+
+-- Comments
+CREATE INDEX IF NOT EXISTS idx_comments_search_vector ON comments USING GIN (search_vector);
+
+DROP TRIGGER IF EXISTS comments_search_vector_update ON comments;
+CREATE TRIGGER comments_search_vector_update BEFORE INSERT OR UPDATE ON comments
+    FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger(search_vector, 'pg_catalog.english', content);
+
+-- Communities
+CREATE INDEX IF NOT EXISTS idx_communities_search_vector ON communities USING GIN (search_vector);
+
+DROP TRIGGER IF EXISTS communities_search_vector_update ON communities;
+CREATE TRIGGER communities_search_vector_update BEFORE INSERT OR UPDATE ON communities
+    FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger(search_vector, 'pg_catalog.english', name, description);
+
+-- Backfill existing rows
+UPDATE comments SET search_vector = to_tsvector('pg_catalog.english', coalesce(content, ''));
+UPDATE communities SET search_vector = to_tsvector('pg_catalog.english', coalesce(name, '') || ' ' || coalesce(description, ''));
@@ -0,0 +1,16 @@
+-- Store countries.visa_types / popular_cities as native arrays instead of
+-- JSON-encoded TEXT so overlap/containment lookups (&&, @>, = ANY) can use GIN
+
+-- USING clauses can't contain subqueries, so unpack the JSON text in a helper
+CREATE OR REPLACE FUNCTION pg_temp.json_text_to_array(value TEXT)
+RETURNS TEXT[]
+LANGUAGE sql IMMUTABLE
+AS $$
+    SELECT ARRAY(SELECT jsonb_array_elements_text(COALESCE(NULLIF(value, ''), '[]')::jsonb))
+$$;
+
+ALTER TABLE countries
+    ALTER COLUMN visa_types TYPE VARCHAR(50)[] USING pg_temp.json_text_to_array(visa_types),
+    ALTER COLUMN popular_cities TYPE VARCHAR(100)[] USING pg_temp.json_text_to_array(popular_cities);
+
+CREATE INDEX IF NOT EXISTS idx_countries_visa_types_gin ON countries USING GIN (visa_types);
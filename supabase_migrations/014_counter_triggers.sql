@@ -0,0 +1,59 @@
+-- Maintain denormalized counters in the database so a single INSERT/DELETE
+-- on the child table updates its parent atomically (no read-modify-write
+-- round trip from the application, no lost updates under concurrency)
+
+-- comment_likes -> comments.like_count
+CREATE OR REPLACE FUNCTION bump_comment_like_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE comments SET like_count = COALESCE(like_count, 0) + 1 WHERE id = NEW.comment_id;
+    ELSE
+        UPDATE comments SET like_count = GREATEST(COALESCE(like_count, 0) - 1, 0) WHERE id = OLD.comment_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS trg_comment_like_count ON comment_likes;
+CREATE TRIGGER trg_comment_like_count AFTER INSERT OR DELETE ON comment_likes
+    FOR EACH ROW EXECUTE FUNCTION bump_comment_like_count();
+
+-- group_message_likes -> group_messages.like_count
+CREATE OR REPLACE FUNCTION bump_group_message_like_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE group_messages SET like_count = COALESCE(like_count, 0) + 1 WHERE id = NEW.message_id;
+    ELSE
+        UPDATE group_messages SET like_count = GREATEST(COALESCE(like_count, 0) - 1, 0) WHERE id = OLD.message_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS trg_group_message_like_count ON group_message_likes;
+CREATE TRIGGER trg_group_message_like_count AFTER INSERT OR DELETE ON group_message_likes
+    FOR EACH ROW EXECUTE FUNCTION bump_group_message_like_count();
+
+-- community_members -> communities.member_count
+CREATE OR REPLACE FUNCTION bump_community_member_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE communities SET member_count = COALESCE(member_count, 0) + 1 WHERE id = NEW.community_id;
+    ELSE
+        UPDATE communities SET member_count = GREATEST(COALESCE(member_count, 0) - 1, 0) WHERE id = OLD.community_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS trg_community_member_count ON community_members;
+CREATE TRIGGER trg_community_member_count AFTER INSERT OR DELETE ON community_members
+    FOR EACH ROW EXECUTE FUNCTION bump_community_member_count();
+
+-- Resync counters once so the triggers start from correct values
+UPDATE comments c SET like_count = (SELECT COUNT(*) FROM comment_likes cl WHERE cl.comment_id = c.id);
+UPDATE group_messages gm SET like_count = (SELECT COUNT(*) FROM group_message_likes gml WHERE gml.message_id = gm.id);
+UPDATE communities c SET member_count = (SELECT COUNT(*) FROM community_members cm WHERE cm.community_id = c.id);
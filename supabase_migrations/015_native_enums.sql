@@ -0,0 +1,41 @@
+-- Replace short VARCHAR enum columns with native ENUM types
+-- (4 bytes per value, integer comparisons, smaller indexes)
+
+DO $$ BEGIN
+    CREATE TYPE message_role AS ENUM ('user', 'assistant', 'system');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE message_content_type AS ENUM ('text', 'image', 'file');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE community_member_role AS ENUM ('member', 'moderator', 'admin');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE comment_status AS ENUM ('published', 'edited', 'deleted');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+-- chat_messages
+ALTER TABLE chat_messages ALTER COLUMN content_type DROP DEFAULT;
+ALTER TABLE chat_messages
+    ALTER COLUMN role TYPE message_role USING role::message_role,
+    ALTER COLUMN content_type TYPE message_content_type USING content_type::message_content_type;
+ALTER TABLE chat_messages ALTER COLUMN content_type SET DEFAULT 'text';
+
+-- community_members
+ALTER TABLE community_members ALTER COLUMN role DROP DEFAULT;
+ALTER TABLE community_members
+    ALTER COLUMN role TYPE community_member_role USING role::community_member_role;
+ALTER TABLE community_members ALTER COLUMN role SET DEFAULT 'member';
+
+-- comments
+ALTER TABLE comments ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE comments
+    ALTER COLUMN status TYPE comment_status USING status::comment_status;
+ALTER TABLE comments ALTER COLUMN status SET DEFAULT 'published';
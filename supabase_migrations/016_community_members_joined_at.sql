@@ -0,0 +1,7 @@
+-- Store community_members.joined_at as TIMESTAMPTZ with a server default and
+-- index it so "joined in the last N days" filters are range scans
+ALTER TABLE community_members
+    ALTER COLUMN joined_at TYPE TIMESTAMP WITH TIME ZONE USING joined_at::timestamptz,
+    ALTER COLUMN joined_at SET DEFAULT NOW();
+
+CREATE INDEX IF NOT EXISTS idx_community_members_joined_at ON community_members(joined_at);
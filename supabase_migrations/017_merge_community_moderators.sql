@@ -0,0 +1,36 @@
+-- Fold community_moderators into community_members: moderators are members
+-- with role 'moderator'/'admin', so promotion is a single UPDATE
+
+ALTER TABLE community_members
+    ADD COLUMN IF NOT EXISTS permissions VARCHAR(200),
+    ADD COLUMN IF NOT EXISTS appointed_by INTEGER REFERENCES users(id),
+    ADD COLUMN IF NOT EXISTS appointed_at TIMESTAMP WITH TIME ZONE;
+
+DO $$ BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name = 'community_moderators') THEN
+        -- Promote existing members
+        UPDATE community_members cm
+        SET role = 'moderator',
+            permissions = mo.permissions,
+            appointed_by = mo.appointed_by,
+            appointed_at = mo.appointed_at
+        FROM community_moderators mo
+        WHERE cm.user_id = mo.user_id
+          AND cm.community_id = mo.community_id
+          AND cm.role = 'member';
+
+        -- Moderators that were never members
+        INSERT INTO community_members (user_id, community_id, role, permissions, appointed_by, appointed_at)
+        SELECT mo.user_id, mo.community_id, 'moderator', mo.permissions, mo.appointed_by, mo.appointed_at
+        FROM community_moderators mo
+        WHERE NOT EXISTS (
+            SELECT 1 FROM community_members cm
+            WHERE cm.user_id = mo.user_id AND cm.community_id = mo.community_id
+        );
+
+        DROP TABLE community_moderators;
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_community_members_moderators ON community_members(community_id, user_id)
+    WHERE role IN ('moderator', 'admin');
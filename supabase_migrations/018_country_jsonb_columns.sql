@@ -0,0 +1,11 @@
+-- JSON stored in TEXT columns becomes JSONB: parsed once on write, returned
+-- as dicts/lists by the driver, and usable with ->, @> and GIN indexes
+
+ALTER TABLE countries
+    ALTER COLUMN fees_info TYPE JSONB USING NULLIF(fees_info, '')::jsonb;
+
+ALTER TABLE visa_types
+    ALTER COLUMN eligibility_criteria TYPE JSONB USING NULLIF(eligibility_criteria, '')::jsonb,
+    ALTER COLUMN required_documents TYPE JSONB USING NULLIF(required_documents, '')::jsonb,
+    ALTER COLUMN fees TYPE JSONB USING NULLIF(fees, '')::jsonb,
+    ALTER COLUMN restrictions TYPE JSONB USING NULLIF(restrictions, '')::jsonb;
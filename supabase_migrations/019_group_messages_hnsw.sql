@@ -0,0 +1,13 @@
+-- Replace the IVFFlat index on group_messages.content_embedding with HNSW:
+-- better speed/recall trade-off and no degradation under continuous inserts
+
+-- Give the build enough memory so the graph fits and can use parallel workers
+SET maintenance_work_mem = '2GB';
+SET max_parallel_maintenance_workers = 4;
+
+DROP INDEX IF EXISTS idx_group_messages_content_embedding;
+CREATE INDEX idx_group_messages_content_embedding ON group_messages
+    USING hnsw (content_embedding vector_cosine_ops) WITH (m = 24, ef_construction = 128);
+
+RESET maintenance_work_mem;
+RESET max_parallel_maintenance_workers;
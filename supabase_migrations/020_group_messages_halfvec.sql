@@ -0,0 +1,17 @@
+-- Store group message embeddings as halfvec (FP16): half the bytes per row
+-- and per distance computation, with negligible recall loss
+-- Requires pgvector >= 0.7.0
+
+SET maintenance_work_mem = '2GB';
+SET max_parallel_maintenance_workers = 4;
+
+DROP INDEX IF EXISTS idx_group_messages_content_embedding;
+
+ALTER TABLE group_messages
+    ALTER COLUMN content_embedding TYPE halfvec(1536) USING content_embedding::halfvec(1536);
+
+CREATE INDEX idx_group_messages_content_embedding ON group_messages
+    USING hnsw (content_embedding halfvec_cosine_ops) WITH (m = 24, ef_construction = 128);
+
+RESET maintenance_work_mem;
+RESET max_parallel_maintenance_workers;
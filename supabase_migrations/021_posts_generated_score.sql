@@ -0,0 +1,13 @@
+-- Compute posts.score in the database so it can never drift from the vote
+-- counts (and idx_posts_score stays consistent) without an extra UPDATE
+
+DO $$ BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'posts' AND column_name = 'score' AND is_generated = 'NEVER'
+    ) THEN
+        ALTER TABLE posts DROP COLUMN score;
+        ALTER TABLE posts ADD COLUMN score INTEGER GENERATED ALWAYS AS (upvotes - downvotes) STORED;
+        CREATE INDEX IF NOT EXISTS idx_posts_score ON posts(score DESC);
+    END IF;
+END $$;
@@ -0,0 +1,4 @@
+-- Store posts.watermark_hash as raw digest bytes instead of a hex string
+-- (half the size, cheaper equality comparisons, smaller index pages)
+ALTER TABLE posts
+    ALTER COLUMN watermark_hash TYPE BYTEA USING decode(watermark_hash, 'hex');
@@ -0,0 +1,13 @@
+-- GIN-index posts.search_vector and keep it populated with the built-in
+-- tsvector trigger so `search_vector @@ ...` can use the index directly
+
+CREATE INDEX IF NOT EXISTS idx_posts_search_vector ON posts USING GIN (search_vector);
+
+-- Replace the hand-rolled trigger from 008 with tsvector_update_trigger
+DROP TRIGGER IF EXISTS update_posts_search_vector ON posts;
+DROP TRIGGER IF EXISTS posts_search_vector_update ON posts;
+CREATE TRIGGER posts_search_vector_update BEFORE INSERT OR UPDATE ON posts
+    FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger(search_vector, 'pg_catalog.english', title, content);
+
+-- Backfill existing rows
+UPDATE posts SET search_vector = to_tsvector('pg_catalog.english', coalesce(title, '') || ' ' || coalesce(content, ''));
@@ -0,0 +1,21 @@
+-- Composite covering indexes for notification and like feeds.
+-- The leading columns make the old single-column indexes redundant:
+-- user_id lookups use the feed index, user_id on likes uses the
+-- UNIQUE(user_id, ...) constraint index.
+
+-- Notifications: unread feed for a user, newest first
+CREATE INDEX IF NOT EXISTS idx_notifications_user_unread_feed
+    ON notifications (user_id, is_read, created_at DESC) INCLUDE (type, title);
+DROP INDEX IF EXISTS idx_notifications_user_id;
+DROP INDEX IF EXISTS idx_notifications_is_read;
+DROP INDEX IF EXISTS idx_notifications_unread;
+
+-- Post likes timeline
+CREATE INDEX IF NOT EXISTS idx_post_likes_post_created ON post_likes (post_id, created_at);
+DROP INDEX IF EXISTS idx_post_likes_post_id;
+DROP INDEX IF EXISTS idx_post_likes_user_id;
+
+-- Comment likes timeline
+CREATE INDEX IF NOT EXISTS idx_comment_likes_comment_created ON comment_likes (comment_id, created_at);
+DROP INDEX IF EXISTS idx_comment_likes_comment_id;
+DROP INDEX IF EXISTS idx_comment_likes_user_id;
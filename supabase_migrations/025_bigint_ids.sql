@@ -0,0 +1,45 @@
+-- Widen integer ids on high-volume tables to BIGINT so joins against
+-- BIGINT columns don't need implicit casts and ids can't overflow.
+-- Tables created from COMPLETE_SCHEMA.sql use UUID keys and are skipped.
+
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    FOR col IN
+        SELECT table_name, column_name
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND data_type = 'integer'
+          AND (table_name, column_name) IN (
+              ('group_messages', 'id'),
+              ('group_message_likes', 'id'),
+              ('group_message_likes', 'message_id'),
+              ('message_read_receipts', 'id'),
+              ('message_read_receipts', 'message_id'),
+              ('notifications', 'id'),
+              ('post_likes', 'id'),
+              ('comment_likes', 'id'),
+              ('search_queries', 'id')
+          )
+    LOOP
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN %I TYPE BIGINT', col.table_name, col.column_name);
+    END LOOP;
+END $$;
+
+-- Serial sequences default to INTEGER; widen them to match
+DO $$
+DECLARE
+    seq TEXT;
+BEGIN
+    FOR seq IN
+        SELECT pg_get_serial_sequence(t, 'id')
+        FROM unnest(ARRAY['group_messages', 'group_message_likes', 'message_read_receipts',
+                          'notifications', 'post_likes', 'comment_likes', 'search_queries']) AS t
+        WHERE to_regclass(t) IS NOT NULL
+    LOOP
+        IF seq IS NOT NULL THEN
+            EXECUTE format('ALTER SEQUENCE %s AS BIGINT', seq);
+        END IF;
+    END LOOP;
+END $$;
@@ -0,0 +1,16 @@
+-- Store notifications.read_at as TIMESTAMPTZ so time-window queries
+-- can use a btree range scan
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'notifications' AND column_name = 'read_at'
+          AND data_type <> 'timestamp with time zone'
+    ) THEN
+        ALTER TABLE notifications
+            ALTER COLUMN read_at TYPE TIMESTAMPTZ USING NULLIF(read_at::text, '')::timestamptz;
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_notifications_read_at ON notifications (read_at);
@@ -0,0 +1,7 @@
+-- Serve "posts tagged X" from an index-only scan on (tag_id, post_id).
+-- post_tags has a surrogate id primary key; post_id lookups are covered by
+-- the index behind its UNIQUE (post_id, tag_id) constraint.
+
+CREATE INDEX IF NOT EXISTS idx_post_tags_tag_post ON post_tags (tag_id, post_id);
+DROP INDEX IF EXISTS idx_post_tags_tag_id;
+DROP INDEX IF EXISTS idx_post_tags_post_id;
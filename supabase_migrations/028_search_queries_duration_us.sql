@@ -0,0 +1,15 @@
+-- Record search latency as BIGINT microseconds instead of INTEGER milliseconds
+
+ALTER TABLE IF EXISTS search_queries ADD COLUMN IF NOT EXISTS search_duration_us BIGINT;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'search_queries' AND column_name = 'search_time'
+    ) THEN
+        UPDATE search_queries SET search_duration_us = ROUND(search_time * 1000)
+        WHERE search_duration_us IS NULL;
+        ALTER TABLE search_queries DROP COLUMN search_time;
+    END IF;
+END $$;
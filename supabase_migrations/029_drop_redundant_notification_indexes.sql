@@ -0,0 +1,8 @@
+-- Unread-notification lookups (badge counts, "mark all read") are served by
+-- the (user_id, is_read, created_at DESC) prefix of
+-- idx_notifications_user_unread_feed from 024. A separate partial index
+-- would duplicate it and be maintained on every insert, so make sure none
+-- is left behind.
+
+DROP INDEX IF EXISTS idx_notifications_unread;
+DROP INDEX IF EXISTS idx_notifications_is_read;
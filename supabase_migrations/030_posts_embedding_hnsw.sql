@@ -0,0 +1,22 @@
+-- Make sure posts.embedding is a pgvector column and replace its
+-- IVFFlat index with HNSW (same parameters as group_messages, see 019)
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'posts' AND column_name = 'embedding' AND data_type = 'ARRAY'
+    ) THEN
+        ALTER TABLE posts ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536);
+    END IF;
+END $$;
+
+SET maintenance_work_mem = '2GB';
+SET max_parallel_maintenance_workers = 4;
+
+DROP INDEX IF EXISTS idx_posts_embedding;
+CREATE INDEX idx_posts_embedding ON posts
+    USING hnsw (embedding vector_cosine_ops) WITH (m = 24, ef_construction = 128);
+
+RESET maintenance_work_mem;
+RESET max_parallel_maintenance_workers;
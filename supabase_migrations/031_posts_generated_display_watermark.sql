@@ -0,0 +1,23 @@
+-- Build posts.display_watermark in the database from the id and an
+-- insert-time epoch, so creating a post no longer needs INSERT + UPDATE
+
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS watermark_epoch BIGINT
+    DEFAULT extract(epoch from now())::bigint;
+
+DO $$ BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'posts' AND column_name = 'display_watermark' AND is_generated = 'NEVER'
+    ) THEN
+        -- Keep the epoch of existing watermarks where it can be recovered
+        UPDATE posts SET watermark_epoch = CASE
+            WHEN display_watermark ~ '-[0-9]+$'
+                THEN substring(display_watermark from '-([0-9]+)$')::bigint
+            ELSE extract(epoch from created_at)::bigint
+        END;
+
+        ALTER TABLE posts DROP COLUMN display_watermark;
+        ALTER TABLE posts ADD COLUMN display_watermark VARCHAR(50) GENERATED ALWAYS AS
+            ('POST-' || substr(id::text, 1, 8) || '-' || watermark_epoch::text) STORED;
+    END IF;
+END $$;
@@ -0,0 +1,7 @@
+-- Trigram index so autocomplete over search_suggestions.suggestion
+-- (ILIKE 'prefix%', ILIKE '%substr%', ORDER BY suggestion <-> :q) is indexed
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_search_suggestions_trgm
+    ON search_suggestions USING GIN (suggestion gin_trgm_ops);
@@ -0,0 +1,23 @@
+-- Key message_read_receipts on (user_id, group_id, message_id) instead of a
+-- synthetic id, so receipts upsert on the natural key with one index
+
+DO $$ BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'message_read_receipts' AND column_name = 'id'
+    ) THEN
+        -- Collapse any duplicates left behind by id-keyed upserts
+        DELETE FROM message_read_receipts a
+            USING message_read_receipts b
+            WHERE a.user_id = b.user_id AND a.group_id = b.group_id AND a.message_id = b.message_id
+              AND a.read_at < b.read_at;
+
+        ALTER TABLE message_read_receipts DROP COLUMN id;
+        ALTER TABLE message_read_receipts ADD PRIMARY KEY (user_id, group_id, message_id);
+    END IF;
+END $$;
+
+-- The primary key replaces the old unique constraint/index
+ALTER TABLE message_read_receipts
+    DROP CONSTRAINT IF EXISTS message_read_receipts_user_id_group_id_message_id_key;
+DROP INDEX IF EXISTS idx_message_read_receipts_user_group_message;
@@ -0,0 +1,11 @@
+-- Let several embedding workers share the queue: jobs are claimed with
+-- SELECT ... FOR UPDATE SKIP LOCKED and stamped with the claiming worker
+
+ALTER TABLE embedding_jobs ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMPTZ;
+ALTER TABLE embedding_jobs ADD COLUMN IF NOT EXISTS claimed_by TEXT;
+ALTER TABLE embedding_jobs ADD COLUMN IF NOT EXISTS processed_at TIMESTAMPTZ;
+
+-- Only unclaimed, unprocessed jobs are candidates for the claim query
+CREATE INDEX IF NOT EXISTS idx_embedding_jobs_claimable
+    ON embedding_jobs (created_at)
+    WHERE processed = false AND claimed_at IS NULL;
@@ -0,0 +1,19 @@
+-- Partial indexes driving the embedding worker's claim and reaper queries.
+-- The claim query locks rows with FOR UPDATE, so it visits the heap for every
+-- candidate anyway; retry_count/error are filtered there rather than carried
+-- in the index. Plain CREATE INDEX so the file runs inside the migration
+-- transaction (embedding_jobs is a small queue table).
+
+-- Claim query: unprocessed, unclaimed jobs in created_at order
+DROP INDEX IF EXISTS idx_embedding_jobs_claimable;
+CREATE INDEX IF NOT EXISTS embedding_jobs_pending_idx
+    ON embedding_jobs (created_at)
+    WHERE processed = false AND claimed_at IS NULL;
+
+-- Reaper query: stale claims on unprocessed jobs
+CREATE INDEX IF NOT EXISTS embedding_jobs_claimed_idx
+    ON embedding_jobs (claimed_at)
+    WHERE processed = false AND claimed_at IS NOT NULL;
+
+-- Superseded by embedding_jobs_pending_idx
+DROP INDEX IF EXISTS idx_embedding_jobs_unprocessed;
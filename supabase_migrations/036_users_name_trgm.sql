@@ -0,0 +1,16 @@
+-- Trigram indexes backing user search on username / full_name (ILIKE '%q%')
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_users_username_trgm
+    ON users USING GIN (username gin_trgm_ops);
+
+DO $$ BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'users' AND column_name = 'full_name'
+    ) THEN
+        CREATE INDEX IF NOT EXISTS idx_users_full_name_trgm
+            ON users USING GIN (full_name gin_trgm_ops);
+    END IF;
+END $$;
@@ -0,0 +1,18 @@
+-- Store post embeddings as halfvec (FP16), as 020 did for group messages:
+-- half the bytes per row and per distance computation in the HNSW scan.
+-- vector arguments to the existing search functions cast implicitly to halfvec.
+-- Requires pgvector >= 0.7.0
+
+SET maintenance_work_mem = '2GB';
+SET max_parallel_maintenance_workers = 4;
+
+DROP INDEX IF EXISTS idx_posts_embedding;
+
+ALTER TABLE posts
+    ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536);
+
+CREATE INDEX idx_posts_embedding ON posts
+    USING hnsw (embedding halfvec_cosine_ops) WITH (m = 24, ef_construction = 128);
+
+RESET maintenance_work_mem;
+RESET max_parallel_maintenance_workers;